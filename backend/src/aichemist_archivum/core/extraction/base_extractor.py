@@ -7,7 +7,7 @@ the base class and registry for dynamic extractor discovery and selection.
 import logging
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, TypeVar
+from typing import Any, ClassVar, TypeVar
 
 from aichemist_archivum.core.fs.file_metadata import FileMetadata
 from aichemist_archivum.utils.io.async_io import AsyncFileIO
@@ -25,6 +25,16 @@ class BaseMetadataExtractor(ABC):
     such as keywords, topics, entities, and other content-based metadata.
     """
 
+    # Whether the class overrides extract_with_content. Computed once per
+    # subclass so callers can dispatch on a class attribute per call.
+    SUPPORTS_CONTENT: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.SUPPORTS_CONTENT = (
+            cls.extract_with_content is not BaseMetadataExtractor.extract_with_content
+        )
+
     def __init__(self) -> None:
         """Initialize the metadata extractor."""
         pass
@@ -59,7 +69,7 @@ class BaseMetadataExtractor(ABC):
     async def extract_with_content(
         self,
         file_path: str | Path,
-        content: str | bytes,  # Changed to str | bytes to match ingestion_service usage
+        content: str | bytes | memoryview,  # memoryview when shared via mmap
         # mime_type and metadata could be added if extractors need them here too
     ) -> T | None:
         """Extract metadata using pre-loaded content.
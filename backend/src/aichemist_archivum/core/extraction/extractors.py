@@ -1,5 +1,12 @@
 """Module for registering metadata extractors."""
 
+import functools
+import logging
+
+logger = logging.getLogger(__name__)
+
+ExtractorClassTuple = tuple[type, float, str | None]
+
 # Placeholder for EXTRACTOR_REGISTRY
 # This should be populated with actual extractor registrations.
 # Example: EXTRACTOR_REGISTRY = {'mime/type': [(ExtractorClass, priority, subtype_filter), ...]}
@@ -18,6 +25,52 @@ def register_extractor(
     EXTRACTOR_REGISTRY[mime_type].append((extractor_class, priority, subtype_filter))
     # Ensure list is sorted by priority (higher priority first)
     EXTRACTOR_REGISTRY[mime_type].sort(key=lambda x: x[1], reverse=True)
+    resolve_extractor_classes.cache_clear()
+
+
+@functools.lru_cache(maxsize=128)
+def resolve_extractor_classes(mime_type: str) -> tuple[ExtractorClassTuple, ...]:
+    """
+    Resolve the extractor classes that apply to a MIME type.
+
+    Merges the registrations for the exact type, its primary wildcard
+    (e.g. 'image/jpeg' -> 'image/*') and '*/*'. Batches are dominated by a
+    handful of MIME types, so results are memoized; ``register_extractor``
+    clears the cache.
+
+    Args:
+        mime_type: The MIME type string (e.g., "text/plain", "image/jpeg").
+
+    Returns:
+        Tuples of (extractor_class, priority, specific_subtype_if_any),
+        sorted by priority (descending).
+    """
+    found: list[ExtractorClassTuple] = list(EXTRACTOR_REGISTRY.get(mime_type, []))
+    primary_type = mime_type.split("/")[0] + "/*"
+
+    # A wildcard registration is skipped when an already selected extractor
+    # is that class or a subclass of it. Recording each selected class's MRO
+    # makes that a set lookup rather than a scan of everything found so far.
+    seen: set[type] = set()
+    for extractor_cls, _, _ in found:
+        seen.update(extractor_cls.__mro__)
+
+    wildcard_types = [primary_type, "*/*"] if mime_type != primary_type else ["*/*"]
+    for wildcard_type in wildcard_types:
+        for extractor_cls, priority, subtype_filter in EXTRACTOR_REGISTRY.get(
+            wildcard_type, []
+        ):
+            if extractor_cls in seen:
+                continue
+            seen.update(extractor_cls.__mro__)
+            found.append((extractor_cls, priority, subtype_filter))
+
+    found.sort(key=lambda x: x[1], reverse=True)
+    if found:
+        logger.debug(
+            f"Extractors for MIME '{mime_type}': {[e[0].__name__ for e in found]}"
+        )
+    return tuple(found)
 
 
 # Example of how extractors might be registered (commented out):
@@ -2,6 +2,7 @@
 
 import logging
 import mimetypes
+import re
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -9,10 +10,47 @@ logger = logging.getLogger(__name__)
 # Initialize mimetypes
 mimetypes.init()
 
+# Leading bytes that identify a format, checked in order
+MAGIC_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"%PDF-", "application/pdf"),
+    (b"PK\x03\x04", "application/zip"),
+    (b"\x1f\x8b", "application/gzip"),
+)
+
+_WEBP_RE = re.compile(rb"RIFF....WEBP", re.DOTALL)
+_HTML_RE = re.compile(rb"\s*<(?:!doctype\s+html|html)[\s>]", re.IGNORECASE)
+
 
 class MimeTypeDetector:
     """Detects MIME types of files."""
 
+    @staticmethod
+    def sniff_header(header: bytes) -> str | None:
+        """
+        Identify a MIME type from the first bytes of a file.
+
+        Every supported format is recognizable from its first few bytes, so
+        callers only need to pass a small prefix (a few KB at most).
+
+        Args:
+            header: Leading bytes of the file content
+
+        Returns:
+            The detected MIME type, or None if no signature matches
+        """
+        for signature, mime_type in MAGIC_SIGNATURES:
+            if header.startswith(signature):
+                return mime_type
+        if _WEBP_RE.match(header):
+            return "image/webp"
+        if _HTML_RE.match(header):
+            return "text/html"
+        return None
+
     @staticmethod
     def get_mime_type(file_path: Path) -> tuple[str, float]:
         """
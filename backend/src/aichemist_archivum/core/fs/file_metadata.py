@@ -6,6 +6,7 @@ and extracted information.
 """
 
 import logging
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -13,6 +14,9 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Error recorded on metadata created for a path that does not exist
+FILE_NOT_FOUND_ERROR = "File not found"
+
 
 @dataclass
 class FileMetadata:
@@ -49,29 +53,53 @@ class FileMetadata:
     language: str | None = None
     content_type: str | None = None
 
+    # stat() result the basic properties were taken from, kept so later
+    # steps (e.g. cache keys) don't have to stat the file again
+    _stat_cache: os.stat_result | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @classmethod
-    async def from_path(cls, path: Path) -> "FileMetadata":
+    async def from_path(
+        cls, path: Path, stat_result: os.stat_result | None = None
+    ) -> "FileMetadata":
         """
         Create FileMetadata from a file path.
 
         Args:
             path: Path to the file.
+            stat_result: Optional stat of the file the caller already has
+                (e.g. from ``os.DirEntry.stat()`` during a directory walk),
+                which skips the stat call.
 
         Returns:
-            FileMetadata instance with basic file properties.
+            FileMetadata instance with basic file properties. A missing file
+            yields metadata with ``size=-1``, ``mime_type="unknown"`` and
+            ``error`` set to ``FILE_NOT_FOUND_ERROR``, so callers need no
+            separate existence check.
         """
         import asyncio
 
         try:
-            stat = await asyncio.to_thread(path.stat)
+            stat = stat_result or await asyncio.to_thread(path.stat)
 
-            return cls(
+            metadata = cls(
                 path=path.resolve(),
                 size=stat.st_size,
                 extension=path.suffix.lower() if path.suffix else None,
                 created_at=datetime.fromtimestamp(stat.st_ctime),
                 modified_at=datetime.fromtimestamp(stat.st_mtime),
             )
+            metadata._stat_cache = stat
+            return metadata
+        except FileNotFoundError:
+            return cls(
+                path=path.resolve(),
+                size=-1,
+                mime_type="unknown",
+                extension=path.suffix.lower() or "",
+                error=FILE_NOT_FOUND_ERROR,
+            )
         except Exception as e:
             logger.error(f"Error creating FileMetadata from path {path}: {e}")
             return cls(
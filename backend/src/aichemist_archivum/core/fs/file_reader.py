@@ -54,12 +54,10 @@ class FileReader:
         if not await self.async_file_io.exists(path):
             raise FileNotFoundError(f"{path} does not exist.")
 
-        # Use the MimeTypeDetector. Needs to run in thread pool as it might block.
+        # MimeTypeDetector only inspects the file name, so it runs inline
+        # rather than paying for a thread pool round trip.
         try:
-            # MimeTypeDetector.get_mime_type is synchronous
-            mime_type = await asyncio.get_event_loop().run_in_executor(
-                self.executor, self.mime_detector.get_mime_type, path
-            )
+            mime_type = self.mime_detector.get_mime_type(path)
             return mime_type
         except Exception as e:
             logger.warning(f"Error determining MIME type for {path}: {e}")
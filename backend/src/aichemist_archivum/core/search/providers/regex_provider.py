@@ -8,8 +8,8 @@ from pathlib import Path
 from typing import cast
 
 from aichemist_archivum.config.settings import REGEX_MAX_COMPLEXITY, REGEX_TIMEOUT_MS
-from aichemist_archivum.utils.batch_processor import BatchProcessor
 from aichemist_archivum.utils.cache.cache_manager import CacheManager
+from aichemist_archivum.utils.concurrency.batch_processor import BatchProcessor
 from aichemist_archivum.utils.io.async_io import AsyncFileIO
 
 logger = logging.getLogger(__name__)
@@ -237,7 +237,7 @@ class RegexSearchProvider:
         # Process files in parallel
         batch_results = await self.batch_processor.process_batch(
             items=file_paths,
-            operation=process_file,
+            processor=process_file,
             batch_size=min(10, len(file_paths)),
             timeout=30,
         )
@@ -18,8 +18,8 @@ from aichemist_archivum.core.embeddings import (
     VectorIndex,
     compute_similarity_matrix,
 )
-from aichemist_archivum.utils.batch_processor import BatchProcessor
 from aichemist_archivum.utils.cache.cache_manager import CacheManager
+from aichemist_archivum.utils.concurrency.batch_processor import BatchProcessor
 from aichemist_archivum.utils.io.async_io import AsyncFileIO
 
 logger = logging.getLogger(__name__)
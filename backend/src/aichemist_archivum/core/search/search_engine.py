@@ -420,7 +420,7 @@ class SearchEngine:
 
         processor = BatchProcessor()
         results = await processor.process_batch(
-            items=file_metadata_list, operation=index_single_file, batch_size=batch_size
+            items=file_metadata_list, processor=index_single_file, batch_size=batch_size
         )
 
         # Filter out None values from failed operations
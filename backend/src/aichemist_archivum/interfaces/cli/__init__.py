@@ -1,10 +1,16 @@
-"""CLI Interface for AIchemist Archivum."""
+"""CLI Interface for AIchemist Archivum.
+
+Command modules register with ``cli_app`` only once loaded, so call ``run()``
+(or ``load_commands()`` before using ``cli_app`` directly).
+"""
 
 from .cli import (
     analyze_app,
     cli_app,
     config_app,
     ingest_app,
+    load_commands,
+    run,
     search_app,
     tag_app,
     version_app,
@@ -15,6 +21,8 @@ __all__ = [
     "cli_app",
     "config_app",
     "ingest_app",
+    "load_commands",
+    "run",
     "search_app",
     "tag_app",
     "version_app",
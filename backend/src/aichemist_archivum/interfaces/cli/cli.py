@@ -7,8 +7,11 @@ file management platform. It includes commands for ingestion, search, tagging,
 versioning, analysis, and configuration.
 """
 
+import importlib
 import logging
+import os
 import sys
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Annotated
 
@@ -81,13 +84,36 @@ cli_app.add_typer(version_app, name="version")
 cli_app.add_typer(analyze_app, name="analyze")
 cli_app.add_typer(config_app, name="config")
 
-# Import command modules to populate the sub-applications
-# Note: These imports must come after the sub-apps are created but before they're used
-try:
-    from .commands import analyze, config, ingest, search, tag, version
-except ImportError:
-    # Commands will be imported when modules are available
-    logger.debug("Command modules not yet available")
+# Modules under .commands that register commands on the sub-app of the same
+# name. The sub-apps above already carry their help text, so a module only
+# has to be imported when its group is actually invoked.
+COMMAND_MODULES = ("analyze", "config", "ingest", "search", "tag", "version")
+
+# Set by the shell completion script; completing needs every command loaded
+COMPLETION_ENV_VAR = "_ARCHIVUM_COMPLETE"
+
+
+def load_commands(names: Iterable[str] = COMMAND_MODULES) -> None:
+    """Import command modules so their commands register with the sub-apps.
+
+    Args:
+        names: Command modules to load; defaults to all of them.
+    """
+    for name in names:
+        try:
+            importlib.import_module(f".commands.{name}", __package__)
+        except ImportError as e:
+            logger.warning(f"Could not import {name} commands: {e}")
+
+
+def run() -> None:
+    """Run the CLI, loading only the command groups named in ``sys.argv``."""
+    if COMPLETION_ENV_VAR in os.environ:
+        load_commands()
+    else:
+        args = set(sys.argv[1:])
+        load_commands(name for name in COMMAND_MODULES if name in args)
+    cli_app()
 
 
 # Global options
@@ -267,4 +293,4 @@ def info() -> None:
 
 
 if __name__ == "__main__":
-    cli_app()
+    run()
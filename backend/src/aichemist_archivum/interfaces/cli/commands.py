@@ -17,16 +17,16 @@ if str(_project_src_dir) not in sys.path:
     sys.path.insert(0, str(_project_src_dir))  # Prepend to path to prioritize
 
 # This import should now be more reliable, assuming
-# aichemist_archivum/interfaces/cli/cli.py defines cli_app.
-from aichemist_archivum.interfaces.cli.cli import cli_app
+# aichemist_archivum/interfaces/cli/cli.py defines run.
+from aichemist_archivum.interfaces.cli.cli import run
 
 
 def main() -> None:
     """
     Main entry point for the CLI application.
-    This function invokes the Typer application.
+    This function loads the requested commands and invokes the Typer application.
     """
-    cli_app()  # cli_app is expected to be the Typer application instance
+    run()
 
 
 if __name__ == "__main__":
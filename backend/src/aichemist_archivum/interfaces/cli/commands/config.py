@@ -125,7 +125,10 @@ async def _initialize_system_async(
         # Initialize database
         console.print("🗄️ Initializing database...")
         database_service = DatabaseService(db_path=data_dir / "archivum.db")
-        await database_service.initialize_schema()
+        try:
+            await database_service.initialize_schema()
+        finally:
+            await database_service.close()
 
         console.print("✅ [green]Initialization completed successfully![/green]")
 
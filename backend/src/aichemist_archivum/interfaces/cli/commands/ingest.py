@@ -152,72 +152,68 @@ async def _ingest_folder_async(
     # Initialize services
     cache_manager = get_cache_manager()
     ingestion_service = IngestionService(cache_manager=cache_manager)
-    database_service = DatabaseService()
-
-    # Initialize database schema
-    await database_service.initialize_schema()
-
-    # Process files with progress bar
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Processing files...", total=len(files_to_process))
-
-        processed = 0
-        errors = 0
-        skipped = 0
-
-        for file_path in files_to_process:
-            try:
-                progress.update(task, description=f"Processing {file_path.name}")
-
-                # Check if already processed (unless force is enabled)
-                if not force:
-                    # This would check database for existing entry
-                    pass
-
-                # Extract metadata
-                metadata = await ingestion_service.extract_metadata(file_path)
-
-                if metadata.error:
-                    errors += 1
-                    console.print(
-                        f"⚠️ Error processing {file_path.name}: {metadata.error}"
-                    )
-                else:
-                    # Save to database
-                    try:
-                        await database_service.save_file_metadata(metadata)
-                        processed += 1
-                    except Exception as e:
+    async with DatabaseService() as database_service:
+        # Process files with progress bar
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Processing files...", total=len(files_to_process))
+
+            processed = 0
+            errors = 0
+            skipped = 0
+
+            for file_path in files_to_process:
+                try:
+                    progress.update(task, description=f"Processing {file_path.name}")
+
+                    # Check if already processed (unless force is enabled)
+                    if not force:
+                        # This would check database for existing entry
+                        pass
+
+                    # Extract metadata
+                    metadata = await ingestion_service.extract_metadata(file_path)
+
+                    if metadata.error:
                         errors += 1
                         console.print(
-                            f"❌ Error saving {file_path.name} to database: {e}"
+                            f"⚠️ Error processing {file_path.name}: {metadata.error}"
                         )
+                    else:
+                        # Save to database
+                        try:
+                            await database_service.save_file_metadata(metadata)
+                            processed += 1
+                        except Exception as e:
+                            errors += 1
+                            console.print(
+                                f"❌ Error saving {file_path.name} to database: {e}"
+                            )
 
-                progress.advance(task)
+                    progress.advance(task)
 
-            except Exception as e:
-                errors += 1
-                console.print(f"❌ Failed to process {file_path.name}: {e}")
-                progress.advance(task)
+                except Exception as e:
+                    errors += 1
+                    console.print(f"❌ Failed to process {file_path.name}: {e}")
+                    progress.advance(task)
 
-    # Display results
-    console.print("\n✅ [bold green]Ingestion completed![/bold green]")
+        # Display results
+        console.print("\n✅ [bold green]Ingestion completed![/bold green]")
 
-    results_table = Table(show_header=False, box=None)
-    results_table.add_column("Metric", style="cyan")
-    results_table.add_column("Count", style="green")
+        results_table = Table(show_header=False, box=None)
+        results_table.add_column("Metric", style="cyan")
+        results_table.add_column("Count", style="green")
 
-    results_table.add_row("Files processed", str(processed))
-    results_table.add_row("Errors", str(errors))
-    results_table.add_row("Skipped", str(skipped))
+        results_table.add_row("Files processed", str(processed))
+        results_table.add_row("Errors", str(errors))
+        results_table.add_row("Skipped", str(skipped))
 
-    console.print(results_table)
+        console.print(results_table)
 
 
 @ingest_app.command("file")
@@ -261,56 +257,52 @@ async def _ingest_file_async(path: Path, force: bool, verbose: bool) -> None:
     # Initialize services
     cache_manager = get_cache_manager()
     ingestion_service = IngestionService(cache_manager=cache_manager)
-    database_service = DatabaseService()
+    async with DatabaseService() as database_service:
+        start_time = time.time()
 
-    # Initialize database schema
-    await database_service.initialize_schema()
+        try:
+            # Extract metadata
+            with console.status("🔄 Processing file..."):
+                metadata = await ingestion_service.extract_metadata(path)
 
-    start_time = time.time()
+            if metadata.error:
+                console.print(f"❌ [red]Error processing file:[/red] {metadata.error}")
+                raise typer.Exit(1)
 
-    try:
-        # Extract metadata
-        with console.status("🔄 Processing file..."):
-            metadata = await ingestion_service.extract_metadata(path)
+            # Save to database
+            try:
+                await database_service.save_file_metadata(metadata)
+            except Exception as e:
+                console.print(f"❌ [red]Error saving to database:[/red] {e}")
+                raise typer.Exit(1)
 
-        if metadata.error:
-            console.print(f"❌ [red]Error processing file:[/red] {metadata.error}")
-            raise typer.Exit(1)
+            processing_time = time.time() - start_time
 
-        # Save to database
-        try:
-            await database_service.save_file_metadata(metadata)
-        except Exception as e:
-            console.print(f"❌ [red]Error saving to database:[/red] {e}")
-            raise typer.Exit(1)
+            # Display results
+            console.print(
+                "✅ [bold green]File processed and saved to database![/bold green]"
+            )
 
-        processing_time = time.time() - start_time
+            if verbose:
+                # Display detailed metadata
+                info_table = Table(title="File Metadata", show_header=False, box=None)
+                info_table.add_column("Property", style="cyan", width=20)
+                info_table.add_column("Value", style="white")
 
-        # Display results
-        console.print(
-            "✅ [bold green]File processed and saved to database![/bold green]"
-        )
-
-        if verbose:
-            # Display detailed metadata
-            info_table = Table(title="File Metadata", show_header=False, box=None)
-            info_table.add_column("Property", style="cyan", width=20)
-            info_table.add_column("Value", style="white")
-
-            info_table.add_row("Path", str(metadata.path))
-            info_table.add_row("Size", format_file_size(metadata.size))
-            info_table.add_row("MIME Type", metadata.mime_type or "Unknown")
-            info_table.add_row("Extension", metadata.extension or "None")
-            info_table.add_row("Processing Time", f"{processing_time:.2f}s")
-            info_table.add_row(
-                "Extraction Complete", "✅" if metadata.extraction_complete else "⚠️"
-            )
+                info_table.add_row("Path", str(metadata.path))
+                info_table.add_row("Size", format_file_size(metadata.size))
+                info_table.add_row("MIME Type", metadata.mime_type or "Unknown")
+                info_table.add_row("Extension", metadata.extension or "None")
+                info_table.add_row("Processing Time", f"{processing_time:.2f}s")
+                info_table.add_row(
+                    "Extraction Complete", "✅" if metadata.extraction_complete else "⚠️"
+                )
 
-            console.print(info_table)
+                console.print(info_table)
 
-    except Exception as e:
-        console.print(f"❌ [red]Failed to process file:[/red] {e}")
-        raise typer.Exit(1)
+        except Exception as e:
+            console.print(f"❌ [red]Failed to process file:[/red] {e}")
+            raise typer.Exit(1)
 
 
 @ingest_app.command("batch")
@@ -386,80 +378,50 @@ async def _ingest_batch_async(file_list: Path, parallel: int, force: bool) -> No
     ingestion_service = IngestionService(
         cache_manager=cache_manager, max_concurrent_batch=parallel
     )
-    database_service = DatabaseService()
-
-    # Initialize database schema
-    await database_service.initialize_schema()
-
-    # Process files with progress tracking
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Processing batch...", total=len(existing_files))
-
-        processed = 0
-        errors = 0
-
-        # Process in chunks to manage memory
-        chunk_size = parallel * 2
-        for i in range(0, len(existing_files), chunk_size):
-            chunk = existing_files[i : i + chunk_size]
-
-            # Process chunk
-            tasks = []
-            for file_path in chunk:
-                task_coro = ingestion_service.extract_metadata(file_path)
-                tasks.append(task_coro)
-
-            try:
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                for j, result in enumerate(results):
-                    if isinstance(result, Exception):
-                        errors += 1
-                        console.print(f"❌ Error processing {chunk[j].name}: {result}")
-                    else:
-                        if result.error:
-                            errors += 1
-                        else:
-                            # Save to database
-                            try:
-                                await database_service.save_file_metadata(result)
-                                processed += 1
-                            except Exception as e:
-                                errors += 1
-                                console.print(
-                                    f"❌ Error saving {chunk[j].name} to database: {e}"
-                                )
-
-                    progress.advance(task)
+    async with DatabaseService() as database_service:
+        # Process files with progress tracking
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+        ) as progress:
+            task = progress.add_task("Processing batch...", total=len(existing_files))
+
+            processed = 0
+            errors = 0
+
+            # The bar advances as each file is extracted; results are saved
+            # to the database in chunks, one transaction per chunk, and
+            # counted once their save has succeeded or failed.
+            async for result in ingestion_service.extract_and_persist_batch(
+                existing_files,
+                database_service,
+                on_extracted=lambda _: progress.advance(task),
+            ):
+                if result.error:
+                    errors += 1
+                else:
+                    processed += 1
 
-            except Exception as e:
-                console.print(f"❌ Batch processing error: {e}")
-                errors += len(chunk)
-                progress.advance(task, len(chunk))
-
-    # Display results
-    console.print("\n✅ [bold green]Batch processing completed![/bold green]")
-
-    results_table = Table(show_header=False, box=None)
-    results_table.add_column("Metric", style="cyan")
-    results_table.add_column("Count", style="green")
-
-    results_table.add_row("Files processed", str(processed))
-    results_table.add_row("Errors", str(errors))
-    results_table.add_row(
-        "Success rate",
-        f"{(processed / (processed + errors) * 100):.1f}%"
-        if (processed + errors) > 0
-        else "0%",
-    )
+        # Display results
+        console.print("\n✅ [bold green]Batch processing completed![/bold green]")
+
+        results_table = Table(show_header=False, box=None)
+        results_table.add_column("Metric", style="cyan")
+        results_table.add_column("Count", style="green")
+
+        results_table.add_row("Files processed", str(processed))
+        results_table.add_row("Errors", str(errors))
+        results_table.add_row(
+            "Success rate",
+            f"{(processed / (processed + errors) * 100):.1f}%"
+            if (processed + errors) > 0
+            else "0%",
+        )
 
-    console.print(results_table)
+        console.print(results_table)
 
 
 @ingest_app.command("status")
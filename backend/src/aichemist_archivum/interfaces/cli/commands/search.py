@@ -362,16 +362,15 @@ async def _search_by_tags_async(
 
     try:
         # Initialize database service
-        database_service = DatabaseService()
-
-        # Search files by tags
-        with console.status("🔄 Searching by tags..."):
-            file_results = await database_service.search_files_by_tags(
-                tags, match_all=match_all
-            )
+        async with DatabaseService() as database_service:
+            # Search files by tags
+            with console.status("🔄 Searching by tags..."):
+                file_results = await database_service.search_files_by_tags(
+                    tags, match_all=match_all
+                )
 
-        # Limit results
-        results = file_results[:max_results]
+            # Limit results
+            results = file_results[:max_results]
 
     except Exception as e:
         console.print(f"❌ [red]Search error:[/red] {e}")
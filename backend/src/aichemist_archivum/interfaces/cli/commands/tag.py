@@ -50,29 +50,28 @@ async def _add_tags_async(file_path: Path, tags: list[str]) -> None:
     console.print(f"Tags: {', '.join(tags)}")
 
     try:
-        database_service = DatabaseService()
-
-        # Check if file exists in database
-        file_info = await database_service.get_file_by_path(file_path)
-
-        if not file_info:
-            console.print(f"❌ [red]File not found in database:[/red] {file_path}")
-            console.print(
-                "💡 Ingest the file first: [cyan]python start.py ingest file {file_path}[/cyan]"
-            )
-            return
+        async with DatabaseService() as database_service:
+            # Check if file exists in database
+            file_info = await database_service.get_file_by_path(file_path)
+
+            if not file_info:
+                console.print(f"❌ [red]File not found in database:[/red] {file_path}")
+                console.print(
+                    "💡 Ingest the file first: [cyan]python start.py ingest file {file_path}[/cyan]"
+                )
+                return
 
-        # Add tags to file
-        await database_service.add_tags_to_file(file_path, tags)
+            # Add tags to file
+            await database_service.add_tags_to_file(file_path, tags)
 
-        console.print("✅ [green]Tags added successfully![/green]")
+            console.print("✅ [green]Tags added successfully![/green]")
 
-        # Show current tags
-        current_tags = await database_service.get_file_tags(file_path)
-        if current_tags:
-            console.print(
-                f"\n📋 Current tags: {', '.join([t['name'] for t in current_tags])}"
-            )
+            # Show current tags
+            current_tags = await database_service.get_file_tags(file_path)
+            if current_tags:
+                console.print(
+                    f"\n📋 Current tags: {', '.join([t['name'] for t in current_tags])}"
+                )
 
     except Exception as e:
         console.print(f"❌ [red]Error adding tags:[/red] {e}")
@@ -108,28 +107,27 @@ async def _remove_tags_async(file_path: Path, tags: list[str]) -> None:
     console.print(f"Tags to remove: {', '.join(tags)}")
 
     try:
-        database_service = DatabaseService()
-
-        # Check if file exists in database
-        file_info = await database_service.get_file_by_path(file_path)
+        async with DatabaseService() as database_service:
+            # Check if file exists in database
+            file_info = await database_service.get_file_by_path(file_path)
 
-        if not file_info:
-            console.print(f"❌ [red]File not found in database:[/red] {file_path}")
-            return
+            if not file_info:
+                console.print(f"❌ [red]File not found in database:[/red] {file_path}")
+                return
 
-        # Remove tags from file
-        await database_service.remove_tags_from_file(file_path, tags)
+            # Remove tags from file
+            await database_service.remove_tags_from_file(file_path, tags)
 
-        console.print("✅ [green]Tags removed successfully![/green]")
+            console.print("✅ [green]Tags removed successfully![/green]")
 
-        # Show remaining tags
-        remaining_tags = await database_service.get_file_tags(file_path)
-        if remaining_tags:
-            console.print(
-                f"📋 Remaining tags: {', '.join([t['name'] for t in remaining_tags])}"
-            )
-        else:
-            console.print("📋 No tags remaining on this file")
+            # Show remaining tags
+            remaining_tags = await database_service.get_file_tags(file_path)
+            if remaining_tags:
+                console.print(
+                    f"📋 Remaining tags: {', '.join([t['name'] for t in remaining_tags])}"
+                )
+            else:
+                console.print("📋 No tags remaining on this file")
 
     except Exception as e:
         console.print(f"❌ [red]Error removing tags:[/red] {e}")
@@ -167,30 +165,31 @@ async def _list_tags_async(
         console.print(f"🏷️  [bold cyan]Tags for:[/bold cyan] {file_path}")
 
         try:
-            database_service = DatabaseService()
-
-            # Get tags for specific file
-            tags = await database_service.get_file_tags(file_path)
-
-            if not tags:
-                console.print("📋 No tags found for this file")
-                return
-
-            table = Table(
-                title=f"Tags for {file_path.name}",
-                show_header=True,
-                header_style="bold cyan",
-            )
-            table.add_column("Tag", style="white")
-            table.add_column("Added", style="blue")
-
-            for tag in tags:
-                table.add_row(
-                    tag["name"],
-                    str(tag.get("added_at", ""))[:19] if tag.get("added_at") else "-",
+            async with DatabaseService() as database_service:
+                # Get tags for specific file
+                tags = await database_service.get_file_tags(file_path)
+
+                if not tags:
+                    console.print("📋 No tags found for this file")
+                    return
+
+                table = Table(
+                    title=f"Tags for {file_path.name}",
+                    show_header=True,
+                    header_style="bold cyan",
                 )
+                table.add_column("Tag", style="white")
+                table.add_column("Added", style="blue")
 
-            console.print(table)
+                for tag in tags:
+                    table.add_row(
+                        tag["name"],
+                        str(tag.get("added_at", ""))[:19]
+                        if tag.get("added_at")
+                        else "-",
+                    )
+
+                console.print(table)
 
         except Exception as e:
             console.print(f"❌ [red]Error listing tags:[/red] {e}")
@@ -198,47 +197,46 @@ async def _list_tags_async(
         console.print("🏷️  [bold cyan]All tags in system[/bold cyan]")
 
         try:
-            database_service = DatabaseService()
-
-            # Get all tags
-            all_tags = await database_service.get_all_tags()
-
-            if not all_tags:
-                console.print("📋 No tags found in system")
-                return
-
-            # Sort tags
-            if sort_by == "name":
-                all_tags.sort(key=lambda x: x["name"])
-            elif sort_by == "count" and show_counts:
-                all_tags.sort(key=lambda x: x.get("usage_count", 0), reverse=True)
-            elif sort_by == "date":
-                all_tags.sort(key=lambda x: x.get("created_at", ""), reverse=True)
-
-            table = Table(
-                title="All Tags",
-                show_header=True,
-                header_style="bold cyan",
-            )
-            table.add_column("Tag", style="white")
+            async with DatabaseService() as database_service:
+                # Get all tags
+                all_tags = await database_service.get_all_tags()
+
+                if not all_tags:
+                    console.print("📋 No tags found in system")
+                    return
+
+                # Sort tags
+                if sort_by == "name":
+                    all_tags.sort(key=lambda x: x["name"])
+                elif sort_by == "count" and show_counts:
+                    all_tags.sort(key=lambda x: x.get("usage_count", 0), reverse=True)
+                elif sort_by == "date":
+                    all_tags.sort(key=lambda x: x.get("created_at", ""), reverse=True)
+
+                table = Table(
+                    title="All Tags",
+                    show_header=True,
+                    header_style="bold cyan",
+                )
+                table.add_column("Tag", style="white")
 
-            if show_counts:
-                table.add_column("Files", style="yellow", justify="right")
+                if show_counts:
+                    table.add_column("Files", style="yellow", justify="right")
 
-            table.add_column("Category", style="blue")
+                table.add_column("Category", style="blue")
 
-            for tag in all_tags:
-                if show_counts:
-                    table.add_row(
-                        tag["name"],
-                        str(tag.get("usage_count", 0)),
-                        tag.get("category", "-") or "-",
-                    )
-                else:
-                    table.add_row(tag["name"], tag.get("category", "-") or "-")
+                for tag in all_tags:
+                    if show_counts:
+                        table.add_row(
+                            tag["name"],
+                            str(tag.get("usage_count", 0)),
+                            tag.get("category", "-") or "-",
+                        )
+                    else:
+                        table.add_row(tag["name"], tag.get("category", "-") or "-")
 
-            console.print(table)
-            console.print(f"\n📊 Total tags: {len(all_tags)}")
+                console.print(table)
+                console.print(f"\n📊 Total tags: {len(all_tags)}")
 
         except Exception as e:
             console.print(f"❌ [red]Error listing tags:[/red] {e}")
@@ -271,26 +269,25 @@ async def _create_tag_async(
     console.print(f"➕ [bold cyan]Creating tag:[/bold cyan] {name}")
 
     try:
-        database_service = DatabaseService()
-
-        # Create the tag
-        tag_id = await database_service.create_tag(name, description, category)
+        async with DatabaseService() as database_service:
+            # Create the tag
+            tag_id = await database_service.create_tag(name, description, category)
 
-        console.print("✅ [green]Tag created successfully![/green]")
+            console.print("✅ [green]Tag created successfully![/green]")
 
-        # Display tag info
-        table = Table(show_header=False, box=None)
-        table.add_column("Property", style="cyan", width=15)
-        table.add_column("Value", style="white")
+            # Display tag info
+            table = Table(show_header=False, box=None)
+            table.add_column("Property", style="cyan", width=15)
+            table.add_column("Value", style="white")
 
-        table.add_row("ID", str(tag_id))
-        table.add_row("Name", name)
-        if description:
-            table.add_row("Description", description)
-        if category:
-            table.add_row("Category", category)
+            table.add_row("ID", str(tag_id))
+            table.add_row("Name", name)
+            if description:
+                table.add_row("Description", description)
+            if category:
+                table.add_row("Category", category)
 
-        console.print(table)
+            console.print(table)
 
     except Exception as e:
         console.print(f"❌ [red]Error creating tag:[/red] {e}")
@@ -314,18 +311,18 @@ async def _tag_stats_async() -> None:
     console.print("📊 [bold cyan]Tag Usage Statistics[/bold cyan]")
 
     try:
-        database_service = DatabaseService()
-        stats = await database_service.get_statistics()
+        async with DatabaseService() as database_service:
+            stats = await database_service.get_statistics()
 
-        table = Table(show_header=False, box=None)
-        table.add_column("Metric", style="cyan", width=25)
-        table.add_column("Value", style="white", justify="right")
+            table = Table(show_header=False, box=None)
+            table.add_column("Metric", style="cyan", width=25)
+            table.add_column("Value", style="white", justify="right")
 
-        table.add_row("Total tags", str(stats.get("total_tags", 0)))
-        table.add_row("Tagged files", str(stats.get("total_file_tags", 0)))
-        table.add_row("Avg tags per file", str(stats.get("avg_tags_per_file", 0)))
+            table.add_row("Total tags", str(stats.get("total_tags", 0)))
+            table.add_row("Tagged files", str(stats.get("total_file_tags", 0)))
+            table.add_row("Avg tags per file", str(stats.get("avg_tags_per_file", 0)))
 
-        console.print(table)
+            console.print(table)
 
     except Exception as e:
         console.print(f"❌ [red]Error getting stats:[/red] {e}")
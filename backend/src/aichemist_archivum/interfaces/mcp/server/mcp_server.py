@@ -14,7 +14,12 @@ import mcp.types as types
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 
-from ..tools import execute_tool, get_database_service, get_tool_definitions
+from ..tools import (
+    close_services,
+    execute_tool,
+    get_database_service,
+    get_tool_definitions,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -138,10 +143,14 @@ def create_mcp_server() -> Server:
 
 async def run_mcp_server() -> None:
     """Run the MCP server with stdio transport."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream, write_stream, server.create_initialization_options()
-        )
+    try:
+        await get_database_service().start()
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream, write_stream, server.create_initialization_options()
+            )
+    finally:
+        await close_services()
 
 
 def main() -> None:
@@ -5,6 +5,7 @@ Exports all tool-related functions for use by the server.
 """
 
 from .tools import (
+    close_services,
     execute_tool,
     get_database_service,
     get_ingestion_service,
@@ -13,6 +14,7 @@ from .tools import (
 )
 
 __all__ = [
+    "close_services",
     "execute_tool",
     "get_database_service",
     "get_ingestion_service",
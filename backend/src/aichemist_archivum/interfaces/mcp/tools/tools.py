@@ -46,6 +46,14 @@ def get_database_service() -> DatabaseService:
     return _database_service
 
 
+async def close_services() -> None:
+    """Close service instances that hold open resources."""
+    global _database_service
+    if _database_service is not None:
+        await _database_service.close()
+        _database_service = None
+
+
 def get_ingestion_service() -> IngestionService:
     """Get or create ingestion service instance."""
     global _ingestion_service
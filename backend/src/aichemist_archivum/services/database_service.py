@@ -5,16 +5,222 @@ Provides database initialization, schema management, and data persistence
 for files, tags, versions, and relationships.
 """
 
+import asyncio
+import json
 import logging
+import os
 import sqlite3
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
-from typing import Any
+from typing import Any, Self
 
 import aiosqlite
 from aichemist_archivum.core.fs.file_metadata import FileMetadata
 
 logger = logging.getLogger(__name__)
 
+# Size of sqlite3's per-connection prepared statement cache (keyed by SQL text).
+# The connection is kept open for the lifetime of the service, so every query
+# in this module is compiled to VDBE bytecode once and reused afterwards.
+STATEMENT_CACHE_SIZE = 256
+
+# Maximum number of read-only connections serving queries alongside the writer
+READ_POOL_SIZE = 4
+
+# Let each connection read the database through a memory map of up to this
+# many bytes instead of pread() calls into its own page cache. Only address
+# space is reserved; SQLite caps it at SQLITE_MAX_MMAP_SIZE at runtime.
+MMAP_SIZE_BYTES = 2 * 1024**3
+
+# Per-connection page cache size in KiB (negative values are KiB in SQLite)
+CACHE_SIZE_KIB = 64_000
+
+# How often the background maintenance task refreshes planner statistics and
+# truncates the write-ahead log.
+MAINTENANCE_INTERVAL_SECONDS = 3600.0
+
+# Full schema, applied with a single executescript() call inside one
+# transaction so a cold start costs one thread hop and one commit.
+SCHEMA_DDL = """
+BEGIN IMMEDIATE;
+
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT UNIQUE NOT NULL,
+    filename TEXT NOT NULL,
+    extension TEXT,
+    mime_type TEXT,
+    size INTEGER,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    last_indexed TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS tags (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT UNIQUE NOT NULL,
+    description TEXT,
+    category TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    usage_count INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS file_tags (
+    file_id INTEGER NOT NULL,
+    tag_id INTEGER NOT NULL,
+    added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (file_id) REFERENCES files(id) ON DELETE CASCADE,
+    FOREIGN KEY (tag_id) REFERENCES tags(id) ON DELETE CASCADE,
+    PRIMARY KEY (file_id, tag_id)
+);
+
+-- Version history lives in the attached analytics database. Foreign keys
+-- cannot span database files, so file_id does not reference files(id).
+CREATE TABLE IF NOT EXISTS stats.versions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    file_id INTEGER NOT NULL,
+    version_hash TEXT NOT NULL,
+    version_number TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    author TEXT,
+    message TEXT,
+    type TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_files_filename ON files(filename);
+-- files(path), tags(name) and file_tags(file_id, tag_id) are already indexed
+-- by their UNIQUE / PRIMARY KEY constraints, so single-column copies of them
+-- only add write cost; drop the ones older databases were created with.
+DROP INDEX IF EXISTS idx_files_path;
+DROP INDEX IF EXISTS idx_tags_name;
+DROP INDEX IF EXISTS idx_file_tags_file_id;
+-- Covering index for tag -> file lookups: the tag search joins can be
+-- answered from index pages alone. tags(name) needs no companion (name, id)
+-- index since id is the rowid and already part of every index entry.
+-- Supersedes the single-column idx_file_tags_tag_id.
+CREATE INDEX IF NOT EXISTS idx_file_tags_tag_file ON file_tags(tag_id, file_id);
+DROP INDEX IF EXISTS idx_file_tags_tag_id;
+CREATE INDEX IF NOT EXISTS stats.idx_versions_file_id ON versions(file_id);
+
+-- Keep tags.usage_count in step with file_tags so listing tags is a plain
+-- scan of the tags table. INSERT OR IGNORE skips the trigger for existing
+-- pairs, and cascaded deletes fire the delete trigger.
+CREATE TRIGGER IF NOT EXISTS trg_file_tags_insert AFTER INSERT ON file_tags
+BEGIN
+    UPDATE tags SET usage_count = usage_count + 1 WHERE id = NEW.tag_id;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_file_tags_delete AFTER DELETE ON file_tags
+BEGIN
+    UPDATE tags SET usage_count = usage_count - 1 WHERE id = OLD.tag_id;
+END;
+
+COMMIT;
+"""
+
+UPSERT_FILE_SQL = """
+    INSERT INTO files (path, filename, extension, mime_type, size)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(path) DO UPDATE SET
+        filename = excluded.filename,
+        extension = excluded.extension,
+        mime_type = excluded.mime_type,
+        size = excluded.size,
+        updated_at = CURRENT_TIMESTAMP,
+        last_indexed = CURRENT_TIMESTAMP
+"""
+
+UPSERT_FILE_RETURNING_ID_SQL = UPSERT_FILE_SQL + "RETURNING id"
+
+FILE_ID_BY_PATH_SQL = "SELECT id FROM files WHERE path = ?"
+
+# Tag writes go through executemany: one prepared statement stepped once per
+# row, with a single thread hop per call instead of one per tag.
+INSERT_TAG_SQL = "INSERT OR IGNORE INTO tags (name) VALUES (?)"
+
+# (file_id, tag_name) -> association; existing pairs are ignored
+LINK_TAG_BY_NAME_SQL = """
+    INSERT OR IGNORE INTO file_tags (file_id, tag_id)
+    SELECT ?, id FROM tags WHERE name = ?
+"""
+
+# (path, tag_name) -> association; paths not in the database match nothing
+LINK_TAG_BY_PATH_SQL = """
+    INSERT OR IGNORE INTO file_tags (file_id, tag_id)
+    SELECT f.id, t.id FROM files f, tags t
+    WHERE f.path = ? AND t.name = ?
+"""
+
+# (file_id, tag_name) -> removed association
+UNLINK_TAG_BY_NAME_SQL = """
+    DELETE FROM file_tags
+    WHERE file_id = ? AND tag_id = (SELECT id FROM tags WHERE name = ?)
+"""
+
+ALL_TAGS_SQL = """
+    SELECT id, name, description, category, created_at, usage_count
+    FROM tags
+    ORDER BY name
+"""
+
+# Files having ALL of the tags in the JSON array parameter. The CTE resolves
+# matching file ids from the (tag_id, file_id) index in one pass; each file's
+# tag list is then a correlated lookup on the file_tags primary key.
+FILES_BY_ALL_TAGS_SQL = """
+    WITH matches AS (
+        SELECT ft.file_id
+        FROM file_tags ft
+        JOIN tags t ON t.id = ft.tag_id
+        WHERE t.name IN (SELECT value FROM json_each(?))
+        GROUP BY ft.file_id
+        HAVING COUNT(*) = ?
+    )
+    SELECT f.*, (
+        SELECT GROUP_CONCAT(t.name)
+        FROM file_tags ft
+        JOIN tags t ON t.id = ft.tag_id
+        WHERE ft.file_id = f.id
+    ) AS tags
+    FROM files f
+    JOIN matches m ON m.file_id = f.id
+"""
+
+# Files having ANY of the tags in the JSON array parameter. GROUP BY f.id
+# already yields one row per file, so no DISTINCT pass is needed.
+FILES_BY_ANY_TAG_SQL = """
+    SELECT f.*, GROUP_CONCAT(t.name) as tags
+    FROM files f
+    JOIN file_tags ft ON f.id = ft.file_id
+    JOIN tags t ON ft.tag_id = t.id
+    WHERE t.name IN (SELECT value FROM json_each(?))
+    GROUP BY f.id
+"""
+
+
+def _column_names(cursor: aiosqlite.Cursor) -> list[str]:
+    """Return the result column names of the cursor's last query."""
+    return [column[0] for column in cursor.description]
+
+
+def _rows_to_dicts(
+    cursor: aiosqlite.Cursor, rows: Iterable[tuple[Any, ...]]
+) -> list[dict[str, Any]]:
+    """
+    Convert plain result tuples to dictionaries keyed by column name.
+
+    Zipping tuples against column names fetched once per query is much cheaper
+    than ``dict(row)`` on ``aiosqlite.Row``, which goes through the mapping
+    protocol column by column for every row.
+    """
+    columns = _column_names(cursor)
+    return [dict(zip(columns, row, strict=True)) for row in rows]
+
+
+def _metadata_row(metadata: FileMetadata) -> tuple[Any, ...]:
+    """Build the UPSERT_FILE_SQL parameters for one file."""
+    path = metadata.path
+    return (str(path), path.name, metadata.extension, metadata.mime_type, metadata.size)
+
 
 class DatabaseService:
     """
@@ -24,12 +230,23 @@ class DatabaseService:
     for files, tags, versions, and relationships.
     """
 
-    def __init__(self, db_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        analytics_db_path: Path | None = None,
+        durable: bool = True,
+    ) -> None:
         """
         Initialize the database service.
 
         Args:
             db_path: Path to the SQLite database file. If None, uses default location.
+            analytics_db_path: Path to the database holding derived/history tables
+                (``versions``), attached as the ``stats`` schema. If None, it is
+                placed next to ``db_path`` as ``<stem>_analytics<suffix>``.
+            durable: If False, the writer runs with ``synchronous = NORMAL``, which
+                under WAL only syncs at checkpoints and may lose the last commits
+                on power loss. Meant for throwaway databases such as test fixtures.
         """
         if db_path is None:
             from aichemist_archivum.config import DATA_DIR
@@ -37,94 +254,210 @@ class DatabaseService:
             db_path = DATA_DIR / "archivum.db"
 
         self.db_path = Path(db_path)
+        if analytics_db_path is None:
+            analytics_db_path = self.db_path.with_name(
+                f"{self.db_path.stem}_analytics{self.db_path.suffix}"
+            )
+        self.analytics_db_path = Path(analytics_db_path)
+        self.durable = durable
         self._initialized = False
+        self._conn: aiosqlite.Connection | None = None
+        self._conn_lock = asyncio.Lock()
+        self._idle_readers: list[aiosqlite.Connection] = []
+        self._readers: set[aiosqlite.Connection] = set()
+        self._read_slots = asyncio.Semaphore(READ_POOL_SIZE)
+        self._schema_lock = asyncio.Lock()
+        self._maintenance_task: asyncio.Task[None] | None = None
         logger.info(f"Database service initialized with path: {self.db_path}")
 
+    async def _open_connection(self, read_only: bool = False) -> aiosqlite.Connection:
+        """
+        Open a long-lived connection to the database.
+
+        Args:
+            read_only: Open the database files with ``mode=ro`` so the connection
+                can never take the write lock. Used for the read pool.
+        """
+        if read_only:
+            database = f"{self.db_path.resolve().as_uri()}?mode=ro"
+            analytics = f"{self.analytics_db_path.resolve().as_uri()}?mode=ro"
+        else:
+            # Ensure parent directory exists
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            database = self.db_path.resolve().as_uri()
+            analytics = self.analytics_db_path.resolve().as_uri()
+
+        conn = await aiosqlite.connect(
+            database, uri=True, cached_statements=STATEMENT_CACHE_SIZE
+        )
+        # Foreign keys are a per-connection setting (and a no-op inside a
+        # transaction), so enable them once here. SQLite builds compiled with
+        # -DSQLITE_DEFAULT_FOREIGN_KEYS=1 already have them on by default.
+        await conn.execute("PRAGMA foreign_keys = ON")
+        await conn.execute("PRAGMA temp_store = MEMORY")
+        # Setting mmap_size returns the new value; close the cursor to finalize it
+        cursor = await conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE_BYTES}")
+        await cursor.close()
+        await conn.execute(f"PRAGMA cache_size = -{CACHE_SIZE_KIB}")
+        # Version history and other derived data live in a second file so their
+        # writes and long-running aggregates don't contend with the indexer on
+        # the main database's journal.
+        await conn.execute("ATTACH DATABASE ? AS stats", (analytics,))
+        if not read_only:
+            # WAL lets the read pool run queries while the writer commits. The
+            # pragma returns a row, so close the cursor to finalize it.
+            cursor = await conn.execute("PRAGMA journal_mode = WAL")
+            await cursor.close()
+            if not self.durable:
+                await conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Acquire the write connection for the duration of one operation.
+
+        Operations are serialized so a commit issued by one caller can never
+        flush another caller's half-finished transaction.
+        """
+        async with self._conn_lock:
+            if self._conn is None:
+                self._conn = await self._open_connection()
+            try:
+                yield self._conn
+            except BaseException:
+                await self._conn.rollback()
+                raise
+
+    @asynccontextmanager
+    async def _read_connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Acquire a read-only connection from the pool for one query.
+
+        Up to ``READ_POOL_SIZE`` queries run in parallel with each other and
+        with the writer, without ever touching the writer's lock.
+        """
+        async with self._read_slots:
+            if self._idle_readers:
+                conn = self._idle_readers.pop()
+            else:
+                conn = await self._open_connection(read_only=True)
+                self._readers.add(conn)
+            try:
+                yield conn
+            finally:
+                # close() may have shut this reader while it was checked out
+                if conn in self._readers:
+                    self._idle_readers.append(conn)
+
+    async def __aenter__(self) -> Self:
+        """Start the service; it is closed when the block exits."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the service's connections."""
+        await self.close()
+
+    async def start(self) -> None:
+        """
+        Initialize the schema and start periodic background maintenance.
+
+        Callers that start the service own its maintenance task and must pair
+        this with ``close()``. Calling it again while running is a no-op.
+        """
+        await self.initialize_schema()
+        if self._maintenance_task is None:
+            self._maintenance_task = asyncio.create_task(self._maintenance_loop())
+
+    async def close(self) -> None:
+        """Stop background maintenance and close the database connection."""
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._maintenance_task
+            self._maintenance_task = None
+
+        # Close checked-out readers too, e.g. ones held by abandoned iterators
+        self._idle_readers.clear()
+        while self._readers:
+            await self._readers.pop().close()
+
+        async with self._conn_lock:
+            if self._conn is not None:
+                # Let SQLite refresh planner statistics for the queries this
+                # connection actually ran before its state is thrown away.
+                try:
+                    await self._conn.execute("PRAGMA optimize")
+                except sqlite3.Error as e:
+                    logger.warning(f"PRAGMA optimize failed on close: {e}")
+                await self._conn.close()
+                self._conn = None
+
+    async def _maintenance_loop(self) -> None:
+        """Periodically refresh planner statistics and checkpoint the WAL."""
+        while True:
+            await asyncio.sleep(MAINTENANCE_INTERVAL_SECONDS)
+            try:
+                async with self._connection() as db:
+                    await db.execute("PRAGMA optimize")
+                    await db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                logger.warning(f"Database maintenance failed: {e}")
+
     async def initialize_schema(self) -> None:
-        """Initialize the database schema if it doesn't exist."""
+        """
+        Initialize the database schema if it doesn't exist.
+
+        Safe to call concurrently; the DDL runs at most once per service.
+        Hot paths check ``self._initialized`` inline before calling this so
+        the already-initialized case costs no coroutine frame.
+        """
         if self._initialized:
             return
 
-        # Ensure parent directory exists
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
-        async with aiosqlite.connect(self.db_path) as db:
-            # Enable foreign keys
-            await db.execute("PRAGMA foreign_keys = ON")
-
-            # Create files table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS files (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    path TEXT UNIQUE NOT NULL,
-                    filename TEXT NOT NULL,
-                    extension TEXT,
-                    mime_type TEXT,
-                    size INTEGER,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_indexed TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Create tags table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS tags (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT UNIQUE NOT NULL,
-                    description TEXT,
-                    category TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Create file_tags junction table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS file_tags (
-                    file_id INTEGER NOT NULL,
-                    tag_id INTEGER NOT NULL,
-                    added_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (file_id) REFERENCES files(id) ON DELETE CASCADE,
-                    FOREIGN KEY (tag_id) REFERENCES tags(id) ON DELETE CASCADE,
-                    PRIMARY KEY (file_id, tag_id)
-                )
-            """)
-
-            # Create versions table
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS versions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    file_id INTEGER NOT NULL,
-                    version_hash TEXT NOT NULL,
-                    version_number TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    author TEXT,
-                    message TEXT,
-                    type TEXT,
-                    FOREIGN KEY (file_id) REFERENCES files(id) ON DELETE CASCADE
-                )
-            """)
-
-            # Create indices for performance
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_files_path ON files(path)")
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_files_filename ON files(filename)"
-            )
-            await db.execute("CREATE INDEX IF NOT EXISTS idx_tags_name ON tags(name)")
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_file_tags_file_id ON file_tags(file_id)"
-            )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_file_tags_tag_id ON file_tags(tag_id)"
-            )
-            await db.execute(
-                "CREATE INDEX IF NOT EXISTS idx_versions_file_id ON versions(file_id)"
-            )
+        async with self._schema_lock:
+            if self._initialized:
+                return
 
-            await db.commit()
+            async with self._connection() as db:
+                await db.executescript(SCHEMA_DDL)
 
-        self._initialized = True
-        logger.info("Database schema initialized successfully")
+                # Databases created before tags.usage_count existed need the
+                # column added and backfilled once; the triggers keep it current
+                cursor = await db.execute("PRAGMA table_info(tags)")
+                if "usage_count" not in {row[1] for row in await cursor.fetchall()}:
+                    await db.execute(
+                        "ALTER TABLE tags "
+                        "ADD COLUMN usage_count INTEGER NOT NULL DEFAULT 0"
+                    )
+                    await db.execute("""
+                        UPDATE tags SET usage_count = (
+                            SELECT COUNT(*) FROM file_tags WHERE tag_id = tags.id
+                        )
+                    """)
+                    await db.commit()
+
+                # Move version history out of databases created before the split
+                cursor = await db.execute(
+                    "SELECT 1 FROM main.sqlite_master "
+                    "WHERE type = 'table' AND name = 'versions'"
+                )
+                if await cursor.fetchone():
+                    await db.execute("""
+                        INSERT INTO stats.versions (
+                            id, file_id, version_hash, version_number,
+                            created_at, author, message, type
+                        )
+                        SELECT id, file_id, version_hash, version_number,
+                               created_at, author, message, type
+                        FROM main.versions
+                    """)
+                    await db.execute("DROP TABLE main.versions")
+                    await db.commit()
+
+            self._initialized = True
+            logger.info("Database schema initialized successfully")
 
     async def save_file_metadata(self, metadata: FileMetadata) -> int:
         """
@@ -136,153 +469,158 @@ class DatabaseService:
         Returns:
             File ID from the database.
         """
-        await self.initialize_schema()
-
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("PRAGMA foreign_keys = ON")
+        if not self._initialized:
+            await self.initialize_schema()
 
-            # Check if file already exists
+        async with self._connection() as db:
+            # Insert or update in a single statement (SQLite >= 3.35)
             cursor = await db.execute(
-                "SELECT id FROM files WHERE path = ?", (str(metadata.path),)
+                UPSERT_FILE_RETURNING_ID_SQL, _metadata_row(metadata)
             )
-            existing = await cursor.fetchone()
-
-            if existing:
-                # Update existing file
-                await db.execute(
-                    """
-                    UPDATE files
-                    SET filename = ?, extension = ?, mime_type = ?, size = ?,
-                        updated_at = CURRENT_TIMESTAMP, last_indexed = CURRENT_TIMESTAMP
-                    WHERE path = ?
-                """,
-                    (
-                        metadata.path.name,
-                        metadata.extension,
-                        metadata.mime_type,
-                        metadata.size,
-                        str(metadata.path),
-                    ),
-                )
-                file_id = existing[0]
-                logger.debug(f"Updated file metadata for {metadata.path}")
-            else:
-                # Insert new file
-                cursor = await db.execute(
-                    """
-                    INSERT INTO files (path, filename, extension, mime_type, size)
-                    VALUES (?, ?, ?, ?, ?)
-                """,
-                    (
-                        str(metadata.path),
-                        metadata.path.name,
-                        metadata.extension,
-                        metadata.mime_type,
-                        metadata.size,
-                    ),
-                )
-                file_id = cursor.lastrowid
-                logger.debug(f"Inserted new file metadata for {metadata.path}")
+            file_id = (await cursor.fetchone())[0]
+            # %-style so the message is only formatted when DEBUG is enabled;
+            # this runs once per indexed file.
+            logger.debug("Saved file metadata for %s", metadata.path)
 
             await db.commit()
             return file_id
 
-    async def get_file_by_path(self, path: Path) -> dict[str, Any] | None:
+    async def save_file_metadata_many(
+        self, items: list[FileMetadata], durable: bool = True
+    ) -> None:
+        """
+        Save or update metadata for many files in a single transaction.
+
+        Args:
+            items: FileMetadata objects to persist.
+            durable: If False, skip fsync for this batch (``synchronous = OFF``).
+                Only intended for cold imports that can simply be re-run.
+        """
+        if not items:
+            return
+
+        if not self._initialized:
+            await self.initialize_schema()
+
+        async with self._connection() as db:
+            if not durable:
+                cursor = await db.execute("PRAGMA synchronous")
+                previous_synchronous = (await cursor.fetchone())[0]
+                await db.execute("PRAGMA synchronous = OFF")
+            try:
+                await db.executemany(UPSERT_FILE_SQL, [_metadata_row(m) for m in items])
+                await db.commit()
+            finally:
+                if not durable:
+                    await db.execute(f"PRAGMA synchronous = {previous_synchronous}")
+
+            logger.info("Saved file metadata for %d files", len(items))
+
+    async def get_file_by_path(self, path: Path | str) -> dict[str, Any] | None:
         """
         Get file information by path.
 
         Args:
-            path: Path to the file.
+            path: Path to the file (a ``str`` is used as-is).
 
         Returns:
             Dictionary with file information or None if not found.
         """
-        await self.initialize_schema()
+        if not self._initialized:
+            await self.initialize_schema()
 
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        async with self._read_connection() as db:
             cursor = await db.execute(
-                "SELECT * FROM files WHERE path = ?", (str(path),)
+                "SELECT * FROM files WHERE path = ?", (os.fspath(path),)
             )
             row = await cursor.fetchone()
 
             if row:
-                return dict(row)
+                return dict(zip(_column_names(cursor), row, strict=True))
             return None
 
-    async def add_tags_to_file(self, file_path: Path, tag_names: list[str]) -> None:
+    async def add_tags_to_file(
+        self, file_path: Path | str, tag_names: list[str]
+    ) -> None:
         """
         Add tags to a file.
 
         Args:
-            file_path: Path to the file.
+            file_path: Path to the file (a ``str`` is used as-is).
             tag_names: List of tag names to add.
         """
-        await self.initialize_schema()
-
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("PRAGMA foreign_keys = ON")
+        if not self._initialized:
+            await self.initialize_schema()
 
+        async with self._connection() as db:
             # Get file ID
-            cursor = await db.execute(
-                "SELECT id FROM files WHERE path = ?", (str(file_path),)
-            )
+            cursor = await db.execute(FILE_ID_BY_PATH_SQL, (os.fspath(file_path),))
             file_row = await cursor.fetchone()
 
             if not file_row:
-                logger.warning(f"File not found in database: {file_path}")
+                logger.warning("File not found in database: %s", file_path)
                 return
 
             file_id = file_row[0]
 
-            # Add each tag
-            for tag_name in tag_names:
-                # Ensure tag exists
-                cursor = await db.execute(
-                    "SELECT id FROM tags WHERE name = ?", (tag_name,)
-                )
-                tag_row = await cursor.fetchone()
-
-                if tag_row:
-                    tag_id = tag_row[0]
-                else:
-                    # Create new tag
-                    cursor = await db.execute(
-                        "INSERT INTO tags (name) VALUES (?)", (tag_name,)
-                    )
-                    tag_id = cursor.lastrowid
+            # Create missing tags, then associate them (existing pairs ignored)
+            await db.executemany(INSERT_TAG_SQL, [(name,) for name in tag_names])
+            await db.executemany(
+                LINK_TAG_BY_NAME_SQL, [(file_id, name) for name in tag_names]
+            )
 
-                # Associate tag with file (ignore if already exists)
-                try:
-                    await db.execute(
-                        "INSERT OR IGNORE INTO file_tags (file_id, tag_id) VALUES (?, ?)",
-                        (file_id, tag_id),
-                    )
-                except sqlite3.IntegrityError:
-                    pass  # Tag already associated
+            await db.commit()
+            logger.debug("Added tags %s to file %s", tag_names, file_path)
+
+    async def add_tags_to_files_many(
+        self, items: Iterable[tuple[Path | str, list[str]]]
+    ) -> None:
+        """
+        Add tags to many files in a single transaction.
 
+        Bulk counterpart of :meth:`add_tags_to_file`: missing tags are created
+        and all associations inserted with one ``executemany`` each. Paths not
+        in the database are skipped.
+
+        Args:
+            items: Pairs of (file path, tag names to add to it).
+        """
+        if not self._initialized:
+            await self.initialize_schema()
+
+        pairs = [
+            (os.fspath(file_path), tag_name)
+            for file_path, tag_names in items
+            for tag_name in tag_names
+        ]
+        if not pairs:
+            return
+
+        async with self._connection() as db:
+            await db.executemany(
+                INSERT_TAG_SQL,
+                [(tag_name,) for tag_name in {tag_name for _, tag_name in pairs}],
+            )
+            await db.executemany(LINK_TAG_BY_PATH_SQL, pairs)
             await db.commit()
-            logger.info(f"Added tags {tag_names} to file {file_path}")
+            logger.debug("Added %d tag associations in bulk", len(pairs))
 
     async def remove_tags_from_file(
-        self, file_path: Path, tag_names: list[str]
+        self, file_path: Path | str, tag_names: list[str]
     ) -> None:
         """
         Remove tags from a file.
 
         Args:
-            file_path: Path to the file.
+            file_path: Path to the file (a ``str`` is used as-is).
             tag_names: List of tag names to remove.
         """
-        await self.initialize_schema()
-
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute("PRAGMA foreign_keys = ON")
+        if not self._initialized:
+            await self.initialize_schema()
 
+        async with self._connection() as db:
             # Get file ID
-            cursor = await db.execute(
-                "SELECT id FROM files WHERE path = ?", (str(file_path),)
-            )
+            cursor = await db.execute(FILE_ID_BY_PATH_SQL, (os.fspath(file_path),))
             file_row = await cursor.fetchone()
 
             if not file_row:
@@ -290,36 +628,27 @@ class DatabaseService:
 
             file_id = file_row[0]
 
-            # Remove each tag
-            for tag_name in tag_names:
-                await db.execute(
-                    """
-                    DELETE FROM file_tags
-                    WHERE file_id = ? AND tag_id = (
-                        SELECT id FROM tags WHERE name = ?
-                    )
-                """,
-                    (file_id, tag_name),
-                )
+            await db.executemany(
+                UNLINK_TAG_BY_NAME_SQL, [(file_id, name) for name in tag_names]
+            )
 
             await db.commit()
-            logger.info(f"Removed tags {tag_names} from file {file_path}")
+            logger.debug("Removed tags %s from file %s", tag_names, file_path)
 
-    async def get_file_tags(self, file_path: Path) -> list[dict[str, Any]]:
+    async def get_file_tags(self, file_path: Path | str) -> list[dict[str, Any]]:
         """
         Get all tags for a file.
 
         Args:
-            file_path: Path to the file.
+            file_path: Path to the file (a ``str`` is used as-is).
 
         Returns:
             List of tag dictionaries.
         """
-        await self.initialize_schema()
-
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        if not self._initialized:
+            await self.initialize_schema()
 
+        async with self._read_connection() as db:
             cursor = await db.execute(
                 """
                 SELECT t.id, t.name, t.description, t.category, ft.added_at
@@ -329,11 +658,11 @@ class DatabaseService:
                 WHERE f.path = ?
                 ORDER BY t.name
             """,
-                (str(file_path),),
+                (os.fspath(file_path),),
             )
 
             rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+            return _rows_to_dicts(cursor, rows)
 
     async def get_all_tags(self) -> list[dict[str, Any]]:
         """
@@ -342,22 +671,33 @@ class DatabaseService:
         Returns:
             List of tag dictionaries with usage counts.
         """
-        await self.initialize_schema()
+        if not self._initialized:
+            await self.initialize_schema()
+
+        async with self._read_connection() as db:
+            cursor = await db.execute(ALL_TAGS_SQL)
+            rows = await cursor.fetchall()
+            return _rows_to_dicts(cursor, rows)
 
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+    async def iter_all_tags(self) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream all tags in the system with usage counts.
 
-            cursor = await db.execute("""
-                SELECT t.id, t.name, t.description, t.category, t.created_at,
-                       COUNT(ft.file_id) as usage_count
-                FROM tags t
-                LEFT JOIN file_tags ft ON t.id = ft.tag_id
-                GROUP BY t.id
-                ORDER BY t.name
-            """)
+        Rows are fetched from SQLite in chunks as the caller consumes them, so
+        memory stays bounded for large tag catalogs. One read-pool connection
+        is held until iteration finishes; wrap the iterator in
+        ``contextlib.aclosing`` when breaking out early.
 
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        Yields:
+            Tag dictionaries with usage counts, ordered by name.
+        """
+        if not self._initialized:
+            await self.initialize_schema()
+
+        async with self._read_connection() as db, db.execute(ALL_TAGS_SQL) as cursor:
+            columns = _column_names(cursor)
+            async for row in cursor:
+                yield dict(zip(columns, row, strict=True))
 
     async def create_tag(
         self, name: str, description: str | None = None, category: str | None = None
@@ -373,9 +713,10 @@ class DatabaseService:
         Returns:
             Tag ID.
         """
-        await self.initialize_schema()
+        if not self._initialized:
+            await self.initialize_schema()
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._connection() as db:
             cursor = await db.execute(
                 "INSERT INTO tags (name, description, category) VALUES (?, ?, ?)",
                 (name, description, category),
@@ -397,49 +738,52 @@ class DatabaseService:
         Returns:
             List of file dictionaries.
         """
-        await self.initialize_schema()
+        if not self._initialized:
+            await self.initialize_schema()
 
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
+        sql, params = self._files_by_tags_query(tag_names, match_all)
+        async with self._read_connection() as db:
+            cursor = await db.execute(sql, params)
+            rows = await cursor.fetchall()
+            return _rows_to_dicts(cursor, rows)
 
-            if match_all:
-                # Files must have ALL specified tags
-                placeholders = ",".join("?" * len(tag_names))
-                cursor = await db.execute(
-                    f"""
-                    SELECT f.*, GROUP_CONCAT(t.name) as tags
-                    FROM files f
-                    JOIN file_tags ft ON f.id = ft.file_id
-                    JOIN tags t ON ft.tag_id = t.id
-                    WHERE f.id IN (
-                        SELECT ft2.file_id
-                        FROM file_tags ft2
-                        JOIN tags t2 ON ft2.tag_id = t2.id
-                        WHERE t2.name IN ({placeholders})
-                        GROUP BY ft2.file_id
-                        HAVING COUNT(DISTINCT t2.name) = ?
-                    )
-                    GROUP BY f.id
-                """,
-                    (*tag_names, len(tag_names)),
-                )
-            else:
-                # Files can have ANY of the specified tags
-                placeholders = ",".join("?" * len(tag_names))
-                cursor = await db.execute(
-                    f"""
-                    SELECT DISTINCT f.*, GROUP_CONCAT(t.name) as tags
-                    FROM files f
-                    JOIN file_tags ft ON f.id = ft.file_id
-                    JOIN tags t ON ft.tag_id = t.id
-                    WHERE t.name IN ({placeholders})
-                    GROUP BY f.id
-                """,
-                    tag_names,
-                )
+    async def iter_files_by_tags(
+        self, tag_names: list[str], match_all: bool = False
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream files matching tags.
 
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        Streaming counterpart of :meth:`search_files_by_tags`; rows are fetched
+        in chunks as the caller consumes them. The same connection caveats as
+        :meth:`iter_all_tags` apply.
+
+        Args:
+            tag_names: List of tag names to search for.
+            match_all: If True, files must have all tags. If False, any tag matches.
+
+        Yields:
+            File dictionaries.
+        """
+        if not self._initialized:
+            await self.initialize_schema()
+
+        sql, params = self._files_by_tags_query(tag_names, match_all)
+        async with self._read_connection() as db, db.execute(sql, params) as cursor:
+            columns = _column_names(cursor)
+            async for row in cursor:
+                yield dict(zip(columns, row, strict=True))
+
+    @staticmethod
+    def _files_by_tags_query(
+        tag_names: list[str], match_all: bool
+    ) -> tuple[str, tuple[Any, ...]]:
+        """Build the SQL and parameters for a tag search."""
+        # Tag names travel as a single JSON array parameter so the SQL text is
+        # constant: one cached statement serves any number of tags.
+        tags_json = json.dumps(tag_names)
+        if match_all:
+            return FILES_BY_ALL_TAGS_SQL, (tags_json, len(set(tag_names)))
+        return FILES_BY_ANY_TAG_SQL, (tags_json,)
 
     async def get_statistics(self) -> dict[str, Any]:
         """
@@ -448,9 +792,10 @@ class DatabaseService:
         Returns:
             Dictionary with database statistics.
         """
-        await self.initialize_schema()
+        if not self._initialized:
+            await self.initialize_schema()
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with self._read_connection() as db:
             stats = {}
 
             # Count files
@@ -466,7 +811,7 @@ class DatabaseService:
             stats["total_file_tags"] = (await cursor.fetchone())[0]
 
             # Count versions
-            cursor = await db.execute("SELECT COUNT(*) FROM versions")
+            cursor = await db.execute("SELECT COUNT(*) FROM stats.versions")
             stats["total_versions"] = (await cursor.fetchone())[0]
 
             # Average tags per file
@@ -5,15 +5,26 @@ across different file types using appropriate extractors.
 """
 
 import asyncio
+import hashlib
+import itertools
 import logging
+import mmap
+import os
+import struct
 import time
-from collections.abc import Coroutine
+from collections.abc import AsyncIterator, Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 from aichemist_archivum.core.extraction.base_extractor import BaseMetadataExtractor
-from aichemist_archivum.core.extraction.extractors import EXTRACTOR_REGISTRY
-from aichemist_archivum.core.fs.file_metadata import FileMetadata
+from aichemist_archivum.core.extraction.extractors import (
+    ExtractorClassTuple,
+    resolve_extractor_classes,
+)
+from aichemist_archivum.core.fs.file_metadata import (
+    FILE_NOT_FOUND_ERROR,
+    FileMetadata,
+)
 from aichemist_archivum.utils.cache.cache_manager import CacheManager
 from aichemist_archivum.utils.concurrency.concurrency import TaskManager
 from aichemist_archivum.utils.file_utils import get_mime_type
@@ -21,9 +32,188 @@ from aichemist_archivum.utils.file_utils import get_mime_type
 if TYPE_CHECKING:
     from typing import Self
 
+    from aichemist_archivum.services.database_service import DatabaseService
+
 ExtractorTuple = tuple[BaseMetadataExtractor, float, str | None]
+# (extractor_name, extracted_data, error_message) from one extractor run
+ExtractorResult = tuple[str, dict[str, Any] | None, str | None]
 logger = logging.getLogger(__name__)
 
+# Number of extracted files written to the database per transaction by
+# extract_and_persist_batch; bounds buffered metadata while amortizing commits.
+PERSIST_CHUNK_SIZE = 1000
+
+
+# MIME values meaning detection failed; only the */* extractors apply
+_UNDETERMINED_MIME_TYPES: frozenset[str | None] = frozenset(
+    {None, "", "unknown", "error"}
+)
+
+# MIME values worth re-detecting from content when it is available.
+# application/octet-stream is a usable type for extractor lookup, so it is
+# not in the undetermined set.
+_GENERIC_MIME_TYPES = _UNDETERMINED_MIME_TYPES | {"application/octet-stream"}
+
+# Largest file mapped once and handed to content-capable extractors; larger
+# files are left for each extractor to read itself.
+SHARED_MAP_MAX_BYTES = 1024 * 1024 * 1024
+
+# Keys an extractor may set directly on FileMetadata; anything else is kept
+# under parsed_data[extractor_name].
+_FILE_METADATA_FIELDS = frozenset(
+    name for name in FileMetadata.__dataclass_fields__ if not name.startswith("_")
+)
+
+
+def _merge_extracted(
+    metadata: FileMetadata, extractor_name: str, data: dict[str, Any]
+) -> None:
+    """Copy one extractor's results onto the metadata object.
+
+    Args:
+        metadata: Metadata being populated.
+        extractor_name: Name of the extractor that produced ``data``.
+        data: Extracted values; FileMetadata fields are set as attributes and
+            all other keys are stored in ``parsed_data[extractor_name]``.
+    """
+    extras: dict[str, Any] = {}
+    for key, value in data.items():
+        if key in _FILE_METADATA_FIELDS:
+            setattr(metadata, key, value)
+        else:
+            extras[key] = value
+
+    if extras:
+        if not isinstance(metadata.parsed_data, dict):
+            metadata.parsed_data = {}
+        metadata.parsed_data.setdefault(extractor_name, {}).update(extras)
+
+
+def _extractor_cache_key(
+    path: Path, mtime: float, size: int, extractor_name: str, version: str
+) -> str:
+    """Build the cache key for one extractor run on one file version.
+
+    The inputs are hashed into a fixed-length digest, so keys stay short
+    no matter how long the path is and can be used as cache file names
+    without sanitizing or truncating them.
+
+    Returns:
+        ``"ext_meta::"`` followed by a 32-character hex digest.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    # NUL can't appear in paths or names, so it keeps the fields unambiguous
+    digest.update(os.fsencode(path) + b"\0")
+    digest.update(struct.pack("<dq", mtime, size))
+    digest.update(extractor_name.encode() + b"\0")
+    digest.update(version.encode())
+    return "ext_meta::" + digest.hexdigest()
+
+
+def _resolve_paths(file_paths: list[str | Path]) -> list[Path | Exception]:
+    """Resolve many paths, resolving each distinct parent directory once.
+
+    Equivalent to calling ``Path.resolve()`` on each path. Only the parent is
+    looked up in the cache; a final component that is a symlink (or ``..``)
+    still gets a full resolve.
+
+    Args:
+        file_paths: Paths to resolve.
+
+    Returns:
+        The resolved path for each input, or the exception resolving it raised.
+    """
+    resolved_parents: dict[Path, Path] = {}
+    resolved: list[Path | Exception] = []
+    for file_path in file_paths:
+        path = Path(file_path)
+        try:
+            if path.name in ("", "..") or path.is_symlink():
+                resolved.append(path.resolve())
+                continue
+            parent = resolved_parents.get(path.parent)
+            if parent is None:
+                parent = resolved_parents[path.parent] = path.parent.resolve()
+            resolved.append(parent / path.name)
+        except (OSError, RuntimeError) as e:
+            resolved.append(e)
+    return resolved
+
+
+def _map_file(path: Path) -> tuple[mmap.mmap, memoryview] | None:
+    """Map a file read-only so several extractors can share one view of it.
+
+    Args:
+        path: File to map.
+
+    Returns:
+        The mapping and a memoryview over it, or None if it can't be mapped.
+    """
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Could not map {path} for shared extraction: {e}")
+        return None
+    return mapped, memoryview(mapped)
+
+
+def _unmap_file(mapped: mmap.mmap, view: memoryview) -> None:
+    """Release a mapping created by :func:`_map_file`.
+
+    If an extractor still holds a slice of the view the mapping can't be
+    closed yet; it is then left for garbage collection to unmap.
+    """
+    try:
+        view.release()
+        mapped.close()
+    except BufferError:
+        logger.debug("Shared file mapping still referenced; deferring unmap")
+
+
+class _SharedFileMap:
+    """Maps a file on first request and hands every extractor the same view.
+
+    Extractors answered from the cache never ask for content, so a fully
+    cached file is never opened.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = asyncio.Lock()
+        self._mapped: tuple[mmap.mmap, memoryview] | None = None
+        self._attempted = False
+
+    async def get(self) -> memoryview | None:
+        """Return the shared view, mapping the file on the first call."""
+        async with self._lock:
+            if not self._attempted:
+                self._attempted = True
+                self._mapped = await asyncio.to_thread(_map_file, self._path)
+        return self._mapped[1] if self._mapped is not None else None
+
+    def close(self) -> None:
+        """Release the mapping, if one was made."""
+        if self._mapped is not None:
+            _unmap_file(*self._mapped)
+            self._mapped = None
+
+
+def _stat_once(path: Path) -> tuple[bool, float, int]:
+    """Stat a file with a single syscall.
+
+    Args:
+        path: File to stat.
+
+    Returns:
+        Tuple of (exists, mtime, size); a missing file gives (False, 0.0, 0).
+    """
+    try:
+        stat_result = os.stat(path)
+    except FileNotFoundError:
+        return False, 0.0, 0
+    return True, stat_result.st_mtime, stat_result.st_size
+
 
 class IngestionService:
     """Service for orchestrating metadata extraction from files.
@@ -43,7 +233,15 @@ class IngestionService:
             max_concurrent_batch: Max concurrent tasks for batch processing.
         """
         self.cache_manager = cache_manager
+        self.max_concurrent_batch = max_concurrent_batch
         self.task_manager = TaskManager(max_concurrent=max_concurrent_batch)
+        # Extractors keep no per-file state, so one instance per class is
+        # shared by every extraction this service runs.
+        self._extractor_instances: dict[type, BaseMetadataExtractor] = {}
+        # MIME type -> (resolved classes, matching instance tuples)
+        self._resolved_extractors: dict[
+            str, tuple[tuple[ExtractorClassTuple, ...], tuple[ExtractorTuple, ...]]
+        ] = {}
 
         logger.info(
             f"IngestionService initialized. Cache: {'Enabled' if cache_manager else 'Disabled'}. "
@@ -56,6 +254,7 @@ class IngestionService:
         content: str | bytes | None = None,
         mime_type_override: str | None = None,
         extractors_override: list[BaseMetadataExtractor] | None = None,
+        stat_result: os.stat_result | None = None,
     ) -> FileMetadata:
         """
         Extract metadata from a file.
@@ -65,53 +264,55 @@ class IngestionService:
             content: Optional pre-loaded content (bytes or str)
             mime_type_override: Optionally override MIME type detection
             extractors_override: Optionally use a specific list of extractors
+            stat_result: Optional stat of the file the caller already has
+                (e.g. from ``os.DirEntry.stat()``), saving the stat call
 
         Returns:
-            Enhanced metadata with extracted information
+            Enhanced metadata with extracted information. Failures are recorded
+            in ``error`` rather than raised; only cancellation propagates.
         """
-        path = (
-            Path(file_path).resolve()
-            if isinstance(file_path, str)
-            else file_path.resolve()
+        try:
+            path = Path(file_path).resolve()
+        except (OSError, RuntimeError) as e:
+            # e.g. a symlink loop
+            logger.error(f"Could not resolve path for metadata extraction: {e}")
+            return FileMetadata(path=Path(file_path), error=str(e))
+
+        return await self._extract_resolved(
+            path, content, mime_type_override, extractors_override, stat_result
         )
+
+    async def _extract_resolved(
+        self: "Self",
+        path: Path,
+        content: str | bytes | None = None,
+        mime_type_override: str | None = None,
+        extractors_override: list[BaseMetadataExtractor] | None = None,
+        stat_result: os.stat_result | None = None,
+    ) -> FileMetadata:
+        """Body of :meth:`extract_metadata` for an already resolved path."""
         overall_processing_start_time = time.monotonic()
 
-        if not await asyncio.to_thread(path.exists):
+        # from_path stats the file once and reports a missing file itself
+        metadata = await FileMetadata.from_path(path, stat_result)
+        if metadata.error == FILE_NOT_FOUND_ERROR:
             logger.error(f"File not found for metadata extraction: {path}")
-            metadata = FileMetadata(
-                path=path,
-                mime_type="unknown",
-                size=-1,
-                extension=path.suffix.lower() or "",
-                error="File not found",
-            )
             return metadata
 
-        metadata = await FileMetadata.from_path(path)
-
         try:
             if mime_type_override:
                 metadata.mime_type = mime_type_override
 
             if (
                 content is not None
-                and (
-                    metadata.mime_type is None
-                    or metadata.mime_type == "unknown"
-                    or metadata.mime_type == "application/octet-stream"
-                    or metadata.mime_type == "error"
-                )
+                and metadata.mime_type in _GENERIC_MIME_TYPES
                 and not mime_type_override
             ):
                 detected_content_mime = await get_mime_type(path, content)
                 if detected_content_mime:
                     metadata.mime_type = detected_content_mime
 
-            if (
-                not metadata.mime_type
-                or metadata.mime_type == "unknown"
-                or metadata.mime_type == "error"
-            ):
+            if metadata.mime_type in _UNDETERMINED_MIME_TYPES:
                 logger.warning(
                     f"Could not reliably determine MIME type for {path}. Some extractors may not run."
                 )
@@ -119,15 +320,12 @@ class IngestionService:
             active_extractors: list[ExtractorTuple]
             if extractors_override:
                 active_extractors = [(ext, 1.0, None) for ext in extractors_override]
-            elif metadata.mime_type and metadata.mime_type not in ["unknown", "error"]:
+            elif metadata.mime_type not in _UNDETERMINED_MIME_TYPES:
                 active_extractors = self._get_extractors_for_mime_type(
                     metadata.mime_type
                 )
             else:
-                active_extractors = [
-                    (ext_cls(), prio, sub_type)
-                    for ext_cls, prio, sub_type in EXTRACTOR_REGISTRY.get("*/*", [])
-                ]
+                active_extractors = self._get_extractors_for_mime_type("*/*")
                 if active_extractors:
                     logger.debug(
                         f"Using fallback extractors for {path} due to undetermined MIME type."
@@ -144,10 +342,7 @@ class IngestionService:
                 f"Using extractors for {path}: {[e[0].__class__.__name__ for e in active_extractors]}"
             )
 
-            extraction_tasks: list[
-                Coroutine[Any, Any, tuple[str, dict[str, Any] | None, str | None]]
-            ] = []
-
+            selected_extractors: list[tuple[BaseMetadataExtractor, float]] = []
             for extractor_instance, priority, required_subtype in active_extractors:
                 if (
                     required_subtype
@@ -158,31 +353,71 @@ class IngestionService:
                         f"Skipping extractor {extractor_instance.__class__.__name__} for {path} - subtype mismatch."
                     )
                     continue
+                selected_extractors.append((extractor_instance, priority))
 
-                task = self._run_extractor(
-                    extractor_instance, path, metadata, content, priority
+            # Each task writes its own slot, turning an unexpected exception
+            # into an error result in place, so no post-pass has to sort
+            # exceptions from results.
+            results: list[ExtractorResult] = [("", None, None)] * len(
+                selected_extractors
+            )
+
+            # Without caller-supplied content, share one mapping of the file
+            # between the extractors that accept content instead of each one
+            # reading it. It is only made once one of them misses the cache.
+            shared_map: _SharedFileMap | None = None
+            if (
+                content is None
+                and 0 < metadata.size <= SHARED_MAP_MAX_BYTES
+                and any(
+                    type(extractor_instance).SUPPORTS_CONTENT
+                    for extractor_instance, _ in selected_extractors
                 )
-                extraction_tasks.append(task)
+            ):
+                shared_map = _SharedFileMap(path)
+
+            async def _collect(
+                index: int, extractor_instance: BaseMetadataExtractor, priority: float
+            ) -> None:
+                try:
+                    results[index] = await self._run_extractor(
+                        extractor_instance,
+                        path,
+                        metadata,
+                        content,
+                        priority,
+                        shared_map,
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Exception during batched extraction task for {path}: {e}",
+                        exc_info=True,
+                    )
+                    results[index] = (
+                        extractor_instance.__class__.__name__,
+                        None,
+                        f"Extractor task failed: {type(e).__name__}: {str(e)[:100]}",
+                    )
 
-            results = await asyncio.gather(*extraction_tasks, return_exceptions=True)
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    for index, (extractor_instance, priority) in enumerate(
+                        selected_extractors
+                    ):
+                        task_group.create_task(
+                            _collect(index, extractor_instance, priority)
+                        )
+            finally:
+                if shared_map is not None:
+                    shared_map.close()
 
             current_errors = []
             if metadata.error:
                 current_errors.append(metadata.error)
 
-            any_extractor_failed = False
-            for result in results:
-                if isinstance(result, Exception):
-                    any_extractor_failed = True
-                    error_str = f"Extractor task failed: {type(result).__name__}: {str(result)[:100]}"
-                    current_errors.append(error_str)
-                    logger.error(
-                        f"Exception during batched extraction task for {path}: {result}",
-                        exc_info=result,
-                    )
-                elif isinstance(result, tuple) and result[2]:
-                    any_extractor_failed = True
-                    current_errors.append(result[2])
+            extractor_errors = [error for _, _, error in results if error]
+            any_extractor_failed = bool(extractor_errors)
+            current_errors.extend(extractor_errors)
 
             if current_errors:
                 metadata.error = "; ".join(current_errors)
@@ -214,34 +449,37 @@ class IngestionService:
         extractor: BaseMetadataExtractor,
         path: Path,
         metadata_obj: FileMetadata,
-        file_content: str | bytes | None,
+        file_content: str | bytes | memoryview | None,
         priority: float,
-    ) -> tuple[str, dict[str, Any] | None, str | None]:
+        shared_map: _SharedFileMap | None = None,
+    ) -> ExtractorResult:
         extractor_name = extractor.__class__.__name__
         cache_key = ""
 
-        file_mtime = 0
-        file_size = 0
-        try:
-            if await asyncio.to_thread(path.exists):
-                file_stat = await asyncio.to_thread(path.stat)
-                file_mtime = file_stat.st_mtime
-                file_size = file_stat.st_size
-        except Exception as stat_exc:
-            logger.warning(
-                f"Could not stat file {path} for cache key generation: {stat_exc}"
-            )
-
         if self.cache_manager:
+            # The stat only feeds the cache key, so skip it entirely when
+            # caching is disabled, and reuse the one FileMetadata was built from.
+            file_mtime = 0.0
+            file_size = 0
+            file_stat = metadata_obj._stat_cache
+            if file_stat is not None:
+                file_mtime, file_size = file_stat.st_mtime, file_stat.st_size
+            else:
+                try:
+                    _, file_mtime, file_size = await asyncio.to_thread(_stat_once, path)
+                except OSError as stat_exc:
+                    logger.warning(
+                        f"Could not stat file {path} for cache key generation: {stat_exc}"
+                    )
+
             try:
-                cache_key_parts = [
-                    str(path),
-                    str(file_mtime),
-                    str(file_size),
+                cache_key = _extractor_cache_key(
+                    path,
+                    file_mtime,
+                    file_size,
                     extractor_name,
                     str(getattr(extractor, "VERSION", "1.0")),
-                ]
-                cache_key = "ext_meta::" + "|".join(cache_key_parts)
+                )
 
                 cached_data_raw = await self.cache_manager.get(cache_key)
                 cached_dict: dict[str, Any] | None = None
@@ -252,15 +490,7 @@ class IngestionService:
                     logger.debug(
                         f"Using cached metadata for {path} from {extractor_name}"
                     )
-                    for key, value in cached_dict.items():
-                        if hasattr(metadata_obj, key):
-                            setattr(metadata_obj, key, value)
-                        else:
-                            if not isinstance(metadata_obj.parsed_data, dict):
-                                metadata_obj.parsed_data = {}
-                            if extractor_name not in metadata_obj.parsed_data:
-                                metadata_obj.parsed_data[extractor_name] = {}
-                            metadata_obj.parsed_data[extractor_name][key] = value
+                    _merge_extracted(metadata_obj, extractor_name, cached_dict)
 
                     metadata_obj.extraction_time += cached_dict.get(
                         "_extraction_time_seconds", 0.01
@@ -276,8 +506,12 @@ class IngestionService:
         extracted_data_dict: dict[str, Any] | None = None
         individual_extraction_start_time = time.monotonic()
 
+        supports_content = getattr(type(extractor), "SUPPORTS_CONTENT", False)
+        if supports_content and file_content is None and shared_map is not None:
+            file_content = await shared_map.get()
+
         try:
-            if hasattr(extractor, "extract_with_content") and file_content is not None:
+            if file_content is not None and supports_content:
                 data_from_extractor = await extractor.extract_with_content(
                     path, file_content
                 )
@@ -286,15 +520,7 @@ class IngestionService:
 
             if data_from_extractor and isinstance(data_from_extractor, dict):
                 extracted_data_dict = data_from_extractor
-                for key, value in extracted_data_dict.items():
-                    if hasattr(metadata_obj, key):
-                        setattr(metadata_obj, key, value)
-                    else:
-                        if not isinstance(metadata_obj.parsed_data, dict):
-                            metadata_obj.parsed_data = {}
-                        if extractor_name not in metadata_obj.parsed_data:
-                            metadata_obj.parsed_data[extractor_name] = {}
-                        metadata_obj.parsed_data[extractor_name][key] = value
+                _merge_extracted(metadata_obj, extractor_name, extracted_data_dict)
             else:
                 logger.warning(
                     f"Extractor {extractor_name} did not return a dict for {path}. Got: {type(data_from_extractor)}"
@@ -341,43 +567,141 @@ class IngestionService:
         """
         Extract metadata from multiple files concurrently.
 
+        Prefer :meth:`iter_extract_batch` when results can be handled as they
+        arrive.
+
         Args:
             file_paths: List of file paths
 
         Returns:
-            List of file metadata objects
+            List of file metadata objects, in the same order as ``file_paths``
         """
-        coroutines = [self.extract_metadata(fp) for fp in file_paths]
-        results = await self.task_manager.add_batch_coroutines(coroutines)
-
-        final_results: list[FileMetadata] = []
-        for i, res in enumerate(results):
-            if isinstance(res, FileMetadata):
-                final_results.append(res)
-            elif isinstance(res, Exception):
-                logger.error(
-                    f"Error extracting metadata for {file_paths[i]} in batch: {res}",
-                    exc_info=res,
-                )
-                final_results.append(
-                    FileMetadata(
-                        path=Path(file_paths[i]),
-                        error=str(res),
-                        extraction_complete=False,
-                    )
-                )
-            else:
-                logger.warning(
-                    f"Unexpected result type for {file_paths[i]} in batch: {type(res)}"
-                )
-                final_results.append(
-                    FileMetadata(
-                        path=Path(file_paths[i]),
-                        error=f"Unexpected result type: {type(res)}",
-                        extraction_complete=False,
-                    )
+        results: list[FileMetadata | None] = [None] * len(file_paths)
+        async for index, metadata in self._iter_extract_indexed(file_paths):
+            results[index] = metadata
+        return cast(list[FileMetadata], results)
+
+    async def iter_extract_batch(
+        self: "Self", file_paths: list[str | Path]
+    ) -> AsyncIterator[FileMetadata]:
+        """
+        Extract metadata from multiple files, yielding each result as it completes.
+
+        A slow file only delays its own result, and callers can persist or
+        drop finished metadata without waiting for the whole batch. At most
+        ``max_concurrent_batch`` extractions run at once.
+
+        Args:
+            file_paths: List of file paths
+
+        Yields:
+            File metadata objects in completion order. A failed extraction
+            yields metadata with ``error`` set rather than raising.
+        """
+        async for _, metadata in self._iter_extract_indexed(file_paths):
+            yield metadata
+
+    async def _iter_extract_indexed(
+        self: "Self", file_paths: list[str | Path]
+    ) -> AsyncIterator[tuple[int, FileMetadata]]:
+        """Yield ``(index into file_paths, metadata)`` pairs as extractions finish.
+
+        Only ``max_concurrent_batch`` tasks exist at a time; the next files are
+        scheduled as earlier ones complete.
+        """
+        # Resolve the whole batch in one worker-thread call; sibling files
+        # share their parent directory's realpath.
+        resolved_paths = await asyncio.to_thread(_resolve_paths, file_paths)
+        inputs = enumerate(zip(file_paths, resolved_paths, strict=True))
+        pending: dict[asyncio.Task[FileMetadata], int] = {}
+        try:
+            while True:
+                for index, (fp, resolved) in itertools.islice(
+                    inputs, self.max_concurrent_batch - len(pending)
+                ):
+                    task = asyncio.create_task(self._extract_limited(fp, resolved))
+                    pending[task] = index
+                if not pending:
+                    return
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
-        return final_results
+                for task in done:
+                    yield pending.pop(task), task.result()
+        finally:
+            # Don't leave extractions running if the caller stops early
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def extract_and_persist_batch(
+        self: "Self",
+        file_paths: list[str | Path],
+        database_service: "DatabaseService",
+        chunk_size: int = PERSIST_CHUNK_SIZE,
+        on_extracted: Callable[[FileMetadata], None] | None = None,
+    ) -> AsyncIterator[FileMetadata]:
+        """
+        Extract metadata from multiple files and save it in bulk.
+
+        Successful extractions are buffered and written with
+        ``DatabaseService.save_file_metadata_many`` once ``chunk_size`` have
+        accumulated (and once more at the end), so a batch costs one commit
+        per chunk instead of one per file.
+
+        Args:
+            file_paths: List of file paths
+            database_service: Database to save the metadata to
+            chunk_size: Number of files saved per transaction
+            on_extracted: Called with each file's metadata as soon as its
+                extraction finishes, before it waits for its chunk to be
+                saved. Use it for per-file progress reporting.
+
+        Yields:
+            File metadata objects once they are saved, or immediately when
+            extraction failed. If saving a chunk fails, every file in it is
+            yielded with ``error`` describing the database failure.
+        """
+        pending: list[FileMetadata] = []
+
+        async def _flush() -> list[FileMetadata]:
+            flushed = pending.copy()
+            pending.clear()
+            try:
+                await database_service.save_file_metadata_many(flushed)
+            except Exception as e:
+                logger.error(f"Error saving metadata for {len(flushed)} files: {e}")
+                for metadata in flushed:
+                    metadata.error = f"Database error: {e}"
+            return flushed
+
+        async for metadata in self.iter_extract_batch(file_paths):
+            if on_extracted is not None:
+                on_extracted(metadata)
+            if metadata.error:
+                yield metadata
+                continue
+
+            pending.append(metadata)
+            if len(pending) >= chunk_size:
+                for saved in await _flush():
+                    yield saved
+
+        if pending:
+            for saved in await _flush():
+                yield saved
+
+    async def _extract_limited(
+        self: "Self", file_path: str | Path, resolved: Path | Exception
+    ) -> FileMetadata:
+        """Extract one file under the batch semaphore."""
+        if isinstance(resolved, Exception):
+            logger.error(f"Could not resolve path for metadata extraction: {resolved}")
+            return FileMetadata(path=Path(file_path), error=str(resolved))
+
+        async with self.task_manager.semaphore:
+            # _extract_resolved records failures on the metadata it returns
+            return await self._extract_resolved(resolved)
 
     def _get_extractors_for_mime_type(
         self: "Self", mime_type: str
@@ -393,32 +717,27 @@ class IngestionService:
             A list of tuples: (extractor_instance, priority, specific_subtype_if_any).
             Sorted by priority (descending).
         """
-        found_extractors: list[ExtractorTuple] = []
-        primary_type = mime_type.split("/")[0] + "/*"
-
-        for extractor_cls, priority, subtype_filter in EXTRACTOR_REGISTRY.get(
-            mime_type, []
-        ):
-            found_extractors.append((extractor_cls(), priority, subtype_filter))
-
-        if mime_type != primary_type:
-            for extractor_cls, priority, subtype_filter in EXTRACTOR_REGISTRY.get(
-                primary_type, []
-            ):
-                if not any(
-                    isinstance(ext[0], extractor_cls) for ext in found_extractors
-                ):
-                    found_extractors.append((extractor_cls(), priority, subtype_filter))
-
-        for extractor_cls, priority, subtype_filter in EXTRACTOR_REGISTRY.get(
-            "*/*", []
-        ):
-            if not any(isinstance(ext[0], extractor_cls) for ext in found_extractors):
-                found_extractors.append((extractor_cls(), priority, subtype_filter))
-
-        found_extractors.sort(key=lambda x: x[1], reverse=True)
-        if found_extractors:
-            logger.debug(
-                f"Extractors for MIME '{mime_type}': {[e[0].__class__.__name__ for e in found_extractors]}"
+        classes = resolve_extractor_classes(mime_type)
+        resolved = self._resolved_extractors.get(mime_type)
+        # resolve_extractor_classes returns the same tuple until the registry
+        # changes, so an identity check tells whether the instances are stale.
+        if resolved is None or resolved[0] is not classes:
+            resolved = (
+                classes,
+                tuple(
+                    (self._get_extractor_instance(cls), priority, subtype_filter)
+                    for cls, priority, subtype_filter in classes
+                ),
             )
-        return found_extractors
+            self._resolved_extractors[mime_type] = resolved
+        return list(resolved[1])
+
+    def _get_extractor_instance(
+        self: "Self", extractor_cls: type
+    ) -> BaseMetadataExtractor:
+        """Return the shared instance of an extractor class, creating it once."""
+        instance = self._extractor_instances.get(extractor_cls)
+        if instance is None:
+            instance = extractor_cls()
+            self._extractor_instances[extractor_cls] = instance
+        return instance
@@ -2,6 +2,7 @@
 
 import fnmatch
 import os
+import re
 
 from aichemist_archivum.config import config
 
@@ -18,20 +19,38 @@ class PatternMatcher:
             self.ignore_patterns = set(ignore_patterns)
         else:
             self.ignore_patterns: set[str] = set()
+        self._compile()
+
+    def _compile(self) -> None:
+        """Compile all ignore patterns into a single alternation regex."""
+        # Same translation and case folding fnmatch.fnmatch applies per call,
+        # done once so should_ignore is one regex match instead of a Python
+        # loop over every pattern.
+        self._compiled: re.Pattern[str] | None = (
+            re.compile(
+                "|".join(
+                    f"(?:{fnmatch.translate(os.path.normcase(pattern))})"
+                    for pattern in self.ignore_patterns
+                )
+            )
+            if self.ignore_patterns
+            else None
+        )
 
     def add_patterns(self, patterns: set) -> None:
         """Allows dynamically adding more ignore patterns."""
         self.ignore_patterns.update(patterns)
+        self._compile()
 
     def should_ignore(self, path: str) -> bool:
         """Determines if a given path should be ignored."""
-        norm_path = os.path.normpath(path)
+        if self._compiled is None:
+            return False
+
+        norm_path = os.path.normcase(os.path.normpath(path))
         base_name = os.path.basename(norm_path)
 
-        return any(
-            fnmatch.fnmatch(base_name, pattern) or fnmatch.fnmatch(norm_path, pattern)
-            for pattern in self.ignore_patterns
-        )
+        return bool(self._compiled.match(base_name) or self._compiled.match(norm_path))
 
 
 pattern_matcher = PatternMatcher()
@@ -2,50 +2,74 @@
 
 import asyncio
 import logging
-from collections.abc import Awaitable, Callable
-from typing import Any, TypeVar
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TypeVar, cast
 
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
+R = TypeVar("R")
+
+# Queued once per worker to tell it that no more items are coming
+_STOP = object()
 
 
 class BatchProcessor:
     """Handles batch processing with async support and error handling."""
 
-    @staticmethod
+    def __init__(self, max_workers: int = 5) -> None:
+        """
+        Initialize the batch processor.
+
+        Args:
+            max_workers: Maximum number of items processed concurrently
+        """
+        self.max_workers = max_workers
+
     async def process_batch(
-        items: list[Any],
-        operation: Callable[[Any], Awaitable[Any]],
+        self,
+        items: Iterable[T],
+        processor: Callable[[T], Awaitable[R]],
         batch_size: int = 10,
-        timeout: int = 30,
-    ) -> list[Any]:
+        timeout: float | None = None,
+    ) -> list[R]:
         """
-        Process items in batches using the provided async operation.
+        Process items using the provided async processor.
+
+        ``max_workers`` long-lived worker tasks pull items from a queue holding
+        at most ``batch_size`` pending items, so the number of tasks and
+        coroutines alive at once is bounded no matter how many items there are.
 
         Args:
-            items: List of items to process
-            operation: Async function to apply to each item
-            batch_size: Number of items to process in each batch
-            timeout: Maximum wait time in seconds
+            items: Items to process
+            processor: Async function to apply to each item
+            batch_size: Maximum number of items queued ahead of the workers
+            timeout: Maximum wait time in seconds for each item, or None
 
         Returns:
-            List of results from successful operations
+            List of results from successful operations, in completion order
         """
-        results = []
-        for i in range(0, len(items), batch_size):
-            batch = items[i : i + batch_size]
-            batch_tasks = [operation(item) for item in batch]
-            try:
-                batch_results = await asyncio.gather(
-                    *batch_tasks, return_exceptions=True
-                )
-                # Filter out exceptions and add successful results
-                for result in batch_results:
-                    if not isinstance(result, Exception):
-                        results.append(result)
-                    else:
-                        logger.error(f"Batch operation error: {result}")
-            except TimeoutError:
-                logger.error(f"Batch operation timed out after {timeout} seconds")
+        queue: asyncio.Queue[object] = asyncio.Queue(maxsize=batch_size)
+        results: list[R] = []
+
+        async def worker() -> None:
+            while (item := await queue.get()) is not _STOP:
+                try:
+                    async with asyncio.timeout(timeout):
+                        results.append(await processor(cast(T, item)))
+                except TimeoutError:
+                    logger.error(f"Batch operation timed out after {timeout} seconds")
+                except Exception as e:
+                    logger.error(f"Batch operation error: {e}")
+
+        async with asyncio.TaskGroup() as task_group:
+            for _ in range(self.max_workers):
+                task_group.create_task(worker())
+            for item in items:
+                await queue.put(item)
+            for _ in range(self.max_workers):
+                await queue.put(_STOP)
 
         return results
+
+
+__all__ = ["BatchProcessor"]
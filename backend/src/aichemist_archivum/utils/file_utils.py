@@ -6,20 +6,31 @@ from typing import Any
 
 from aichemist_archivum.core.extraction.mime_detector import MimeTypeDetector
 
+_mime_detector = MimeTypeDetector()
+
+# Bytes of pre-loaded content inspected for magic signatures
+SNIFF_HEADER_BYTES = 4096
+
 
 async def get_mime_type(
     file_path: Path, content: bytes | str | None = None
 ) -> str | None:
-    """Placeholder: Asynchronously get MIME type.
-    `content` is not used in this placeholder but kept for signature compatibility.
+    """Asynchronously get MIME type.
+
+    When ``content`` is given as bytes, its first ``SNIFF_HEADER_BYTES`` are
+    matched against known magic signatures; otherwise (or if nothing matches)
+    the type is guessed from the file name. The file itself is never read.
     """
-    # In a real implementation, if content is provided and large,
-    # it might be used directly with a library like `python-magic`
-    # without reading the file again. For now, uses MimeTypeDetector.
-    detector = MimeTypeDetector()
+    if isinstance(content, bytes):
+        sniffed = _mime_detector.sniff_header(content[:SNIFF_HEADER_BYTES])
+        if sniffed:
+            return sniffed
+
     try:
-        # MimeTypeDetector.get_mime_type is synchronous
-        mime, _ = await asyncio.to_thread(detector.get_mime_type, file_path)
+        # Detection only looks at the file name and never touches the disk,
+        # so it runs inline; a worker-thread hop would cost more than the
+        # lookup itself.
+        mime, _ = _mime_detector.get_mime_type(file_path)
         return mime
     except Exception:
         return None
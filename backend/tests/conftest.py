@@ -4,29 +4,43 @@ Pytest configuration and fixtures for AIchemist Archivum tests.
 This module provides common fixtures and configuration for all tests.
 """
 
-import asyncio
+import os
+import shutil
 import tempfile
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from pathlib import Path
 
+import aiosqlite
 import pytest
 import pytest_asyncio
+from aichemist_archivum.core.fs.file_metadata import FileMetadata
 from aichemist_archivum.core.search.search_engine import SearchEngine
 from aichemist_archivum.services.database_service import DatabaseService
 from aichemist_archivum.services.ingestion_service import IngestionService
 from aichemist_archivum.utils.cache.cache_manager import CacheManager
 
-
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an event loop for the entire test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+# Set to put the session test database on a RAM-backed filesystem. The
+# service's read pool opens the database file read-only alongside the WAL
+# writer, so a ``:memory:`` database can't stand in for it; tmpfs keeps the
+# same file semantics without touching a disk.
+TEST_DB_IN_MEMORY_ENV_VAR = "AICHEMIST_TEST_INMEM"
+RAM_DISK_DIR = Path("/dev/shm")  # noqa: S108 - only a parent for mkdtemp()
+
+# Clears every row a test can write, leaving the schema in place. file_tags
+# goes first so the usage_count triggers never see a dangling tag, and the
+# AUTOINCREMENT counters are reset so ids start at 1 in every test.
+RESET_DATABASE_SQL = """
+DELETE FROM file_tags;
+DELETE FROM files;
+DELETE FROM tags;
+DELETE FROM stats.versions;
+DELETE FROM main.sqlite_sequence;
+DELETE FROM stats.sqlite_sequence;
+"""
 
 
 @pytest.fixture
-def temp_dir() -> Generator[Path, None, None]:
+def temp_dir() -> Generator[Path]:
     """Provide a temporary directory for tests."""
     with tempfile.TemporaryDirectory() as tmpdir:
         yield Path(tmpdir)
@@ -38,12 +52,43 @@ def temp_db_path(temp_dir: Path) -> Path:
     return temp_dir / "test_archivum.db"
 
 
-@pytest_asyncio.fixture
-async def database_service(temp_db_path: Path) -> DatabaseService:
-    """Provide an initialized database service for tests."""
-    service = DatabaseService(db_path=temp_db_path)
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def session_database_service(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> AsyncGenerator[DatabaseService]:
+    """Provide a database service whose schema is created once per session."""
+    # Under pytest-xdist each worker runs its own session, and so gets its own
+    # database; naming it after the worker keeps the files easy to tell apart.
+    db_name = f"test_archivum_{os.environ.get('PYTEST_XDIST_WORKER', 'main')}.db"
+    ram_dir = None
+    if os.environ.get(TEST_DB_IN_MEMORY_ENV_VAR) and RAM_DISK_DIR.is_dir():
+        ram_dir = Path(tempfile.mkdtemp(prefix="archivum-test-", dir=RAM_DISK_DIR))
+        db_path = ram_dir / db_name
+    else:
+        db_path = tmp_path_factory.mktemp("database") / db_name
+    # A throwaway test database doesn't need the writer to sync on every commit
+    service = DatabaseService(db_path=db_path, durable=False)
     await service.initialize_schema()
-    return service
+    yield service
+    await service.close()
+    if ram_dir is not None:
+        shutil.rmtree(ram_dir, ignore_errors=True)
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def database_service(
+    session_database_service: DatabaseService,
+) -> AsyncGenerator[DatabaseService]:
+    """Provide the shared database service, emptied again after each test."""
+    yield session_database_service
+    # A separate connection keeps the reset off the service's internals; WAL
+    # lets it write while the service's own connections sit idle.
+    async with aiosqlite.connect(session_database_service.db_path) as db:
+        await db.execute(
+            "ATTACH DATABASE ? AS stats",
+            (str(session_database_service.analytics_db_path),),
+        )
+        await db.executescript(RESET_DATABASE_SQL)
 
 
 @pytest.fixture
@@ -76,6 +121,23 @@ def sample_text_file(temp_dir: Path) -> Path:
     return file_path
 
 
+@pytest.fixture(scope="session")
+def session_text_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a sample text file shared by the whole test session."""
+    file_path = tmp_path_factory.mktemp("samples") / "sample.txt"
+    file_path.write_text("This is a sample text file for testing.")
+    return file_path
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def sample_text_file_metadata(session_text_file: Path) -> FileMetadata:
+    """Provide metadata for the session sample file, read once per session.
+
+    Shared across tests, so tests must not modify it.
+    """
+    return await FileMetadata.from_path(session_text_file)
+
+
 @pytest.fixture
 def sample_python_file(temp_dir: Path) -> Path:
     """Create a sample Python file for testing."""
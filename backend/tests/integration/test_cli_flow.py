@@ -4,8 +4,10 @@ Integration tests for the CLI flow.
 Tests end-to-end workflows: ingest → search → tag
 """
 
+import asyncio
 from pathlib import Path
 
+import aiofiles
 import pytest
 from aichemist_archivum.core.search.search_engine import SearchEngine
 from aichemist_archivum.services.database_service import DatabaseService
@@ -63,7 +65,7 @@ async def test_ingest_tag_search_flow(
 
     # Verify results
     assert len(results) > 0
-    result_paths = [result["path"] for result in results]
+    result_paths = {result["path"] for result in results}
     assert str(test_file) in result_paths
 
 
@@ -81,11 +83,12 @@ async def test_batch_ingest_flow(
         file_path.write_text(f"Content of batch file {i}")
         files.append(file_path)
 
-    # Ingest all files
-    for file_path in files:
-        metadata = await ingestion_service.extract_metadata(file_path)
-        assert metadata.error is None
-        await database_service.save_file_metadata(metadata)
+    # Ingest all files concurrently, saving them in one transaction
+    metadatas = await asyncio.gather(
+        *(ingestion_service.extract_metadata(file_path) for file_path in files)
+    )
+    assert all(metadata.error is None for metadata in metadatas)
+    await database_service.save_file_metadata_many(metadatas)
 
     # Verify all files are in database
     stats = await database_service.get_statistics()
@@ -101,23 +104,34 @@ async def test_full_workflow(
     """Test a complete realistic workflow."""
     # Create a set of related files
     python_file = temp_dir / "script.py"
-    python_file.write_text("print('Hello, World!')")
-
     readme_file = temp_dir / "README.md"
-    readme_file.write_text("# Project\n\nThis is a test project.")
-
     config_file = temp_dir / "config.yaml"
-    config_file.write_text("key: value\n")
+    contents = {
+        python_file: "print('Hello, World!')",
+        readme_file: "# Project\n\nThis is a test project.",
+        config_file: "key: value\n",
+    }
+
+    async def write_file(path: Path, content: str) -> None:
+        async with aiofiles.open(path, "w") as f:
+            await f.write(content)
+
+    await asyncio.gather(*(write_file(p, c) for p, c in contents.items()))
 
     # Step 1: Ingest all files
-    for file_path in [python_file, readme_file, config_file]:
-        metadata = await ingestion_service.extract_metadata(file_path)
-        await database_service.save_file_metadata(metadata)
+    metadatas = await asyncio.gather(
+        *(ingestion_service.extract_metadata(file_path) for file_path in contents)
+    )
+    await database_service.save_file_metadata_many(metadatas)
 
     # Step 2: Tag files appropriately
-    await database_service.add_tags_to_file(python_file, ["code", "python", "script"])
-    await database_service.add_tags_to_file(readme_file, ["documentation", "markdown"])
-    await database_service.add_tags_to_file(config_file, ["configuration", "yaml"])
+    await database_service.add_tags_to_files_many(
+        [
+            (python_file, ["code", "python", "script"]),
+            (readme_file, ["documentation", "markdown"]),
+            (config_file, ["configuration", "yaml"]),
+        ]
+    )
 
     # Step 3: Search by tags
     code_files = await database_service.search_files_by_tags(["code"], match_all=False)
@@ -4,11 +4,16 @@ Tests for the database service.
 Tests database initialization, CRUD operations for files and tags.
 """
 
+import json
 from pathlib import Path
 
+import aiosqlite
 import pytest
 from aichemist_archivum.core.fs.file_metadata import FileMetadata
-from aichemist_archivum.services.database_service import DatabaseService
+from aichemist_archivum.services.database_service import (
+    FILES_BY_ALL_TAGS_SQL,
+    DatabaseService,
+)
 
 
 @pytest.mark.asyncio
@@ -22,65 +27,91 @@ async def test_database_initialization(database_service: DatabaseService):
     assert stats["total_tags"] == 0
 
 
+@pytest.mark.asyncio
+async def test_database_uses_wal(database_service: DatabaseService):
+    """Test that the database file is switched to WAL mode."""
+    # WAL is persistent in the file, so any connection reports it
+    async with aiosqlite.connect(database_service.db_path) as db:
+        cursor = await db.execute("PRAGMA journal_mode")
+        assert (await cursor.fetchone())[0] == "wal"
+
+
 @pytest.mark.asyncio
 async def test_save_file_metadata(
-    database_service: DatabaseService, sample_text_file: Path
+    database_service: DatabaseService, sample_text_file_metadata: FileMetadata
 ):
     """Test saving file metadata to database."""
-    metadata = await FileMetadata.from_path(sample_text_file)
+    metadata = sample_text_file_metadata
 
     file_id = await database_service.save_file_metadata(metadata)
 
     assert file_id > 0
 
     # Verify file was saved
-    file_info = await database_service.get_file_by_path(sample_text_file)
+    file_info = await database_service.get_file_by_path(metadata.path)
     assert file_info is not None
-    assert file_info["path"] == str(sample_text_file)
+    assert file_info["path"] == str(metadata.path)
 
 
 @pytest.mark.asyncio
-async def test_add_tags_to_file(
+async def test_save_file_metadata_updates_existing(
     database_service: DatabaseService, sample_text_file: Path
 ):
-    """Test adding tags to a file."""
+    """Test that saving the same path twice updates the existing row."""
     metadata = await FileMetadata.from_path(sample_text_file)
+    first_id = await database_service.save_file_metadata(metadata)
+
+    metadata.size = 1234
+    second_id = await database_service.save_file_metadata(metadata)
+
+    assert second_id == first_id
+    file_info = await database_service.get_file_by_path(sample_text_file)
+    assert file_info["size"] == 1234
+
+    stats = await database_service.get_statistics()
+    assert stats["total_files"] == 1
+
+
+@pytest.mark.asyncio
+async def test_add_tags_to_file(
+    database_service: DatabaseService, sample_text_file_metadata: FileMetadata
+):
+    """Test adding tags to a file."""
+    metadata = sample_text_file_metadata
     await database_service.save_file_metadata(metadata)
 
     # Add tags
     tags = ["test", "important", "document"]
-    await database_service.add_tags_to_file(sample_text_file, tags)
+    await database_service.add_tags_to_file(metadata.path, tags)
 
     # Verify tags were added
-    file_tags = await database_service.get_file_tags(sample_text_file)
-    tag_names = [tag["name"] for tag in file_tags]
+    file_tags = await database_service.get_file_tags(metadata.path)
+    tag_names = {tag["name"] for tag in file_tags}
 
-    for tag in tags:
-        assert tag in tag_names
+    assert set(tags) <= tag_names
 
 
 @pytest.mark.asyncio
 async def test_remove_tags_from_file(
-    database_service: DatabaseService, sample_text_file: Path
+    database_service: DatabaseService, sample_text_file_metadata: FileMetadata
 ):
     """Test removing tags from a file."""
-    metadata = await FileMetadata.from_path(sample_text_file)
+    metadata = sample_text_file_metadata
     await database_service.save_file_metadata(metadata)
 
     # Add tags
     tags = ["test", "important", "document"]
-    await database_service.add_tags_to_file(sample_text_file, tags)
+    await database_service.add_tags_to_file(metadata.path, tags)
 
     # Remove one tag
-    await database_service.remove_tags_from_file(sample_text_file, ["important"])
+    await database_service.remove_tags_from_file(metadata.path, ["important"])
 
     # Verify tag was removed
-    file_tags = await database_service.get_file_tags(sample_text_file)
-    tag_names = [tag["name"] for tag in file_tags]
+    file_tags = await database_service.get_file_tags(metadata.path)
+    tag_names = {tag["name"] for tag in file_tags}
 
     assert "important" not in tag_names
-    assert "test" in tag_names
-    assert "document" in tag_names
+    assert {"test", "document"} <= tag_names
 
 
 @pytest.mark.asyncio
@@ -116,6 +147,19 @@ async def test_search_files_by_tags(database_service: DatabaseService, temp_dir:
     assert len(results) == 1
 
 
+@pytest.mark.asyncio
+async def test_search_files_by_all_tags_uses_covering_index(
+    database_service: DatabaseService,
+):
+    """Test that the match-all tag search is answered from the covering index."""
+    params = (json.dumps(["python", "code"]), 2)
+    async with aiosqlite.connect(database_service.db_path) as db:
+        cursor = await db.execute("EXPLAIN QUERY PLAN " + FILES_BY_ALL_TAGS_SQL, params)
+        plan = [row[3] for row in await cursor.fetchall()]
+
+    assert any("COVERING INDEX idx_file_tags_tag_file" in step for step in plan)
+
+
 @pytest.mark.asyncio
 async def test_get_all_tags(database_service: DatabaseService, temp_dir: Path):
     """Test getting all tags in the system."""
@@ -136,16 +180,34 @@ async def test_get_all_tags(database_service: DatabaseService, temp_dir: Path):
     all_tags = await database_service.get_all_tags()
 
     assert len(all_tags) >= 3
-    tag_names = [tag["name"] for tag in all_tags]
-    assert "tag1" in tag_names
-    assert "tag2" in tag_names
-    assert "tag3" in tag_names
+    tag_names = {tag["name"] for tag in all_tags}
+    assert {"tag1", "tag2", "tag3"} <= tag_names
 
     # Check usage counts
     tag2 = [tag for tag in all_tags if tag["name"] == "tag2"][0]
     assert tag2["usage_count"] == 2
 
 
+@pytest.mark.asyncio
+async def test_iter_all_tags_and_files(
+    database_service: DatabaseService, temp_dir: Path
+):
+    """Test streaming tags and tag search results."""
+    file1 = temp_dir / "file1.txt"
+    file1.write_text("File 1")
+    metadata1 = await FileMetadata.from_path(file1)
+    await database_service.save_file_metadata(metadata1)
+    await database_service.add_tags_to_file(file1, ["alpha", "beta"])
+
+    streamed_tags = [tag async for tag in database_service.iter_all_tags()]
+    assert streamed_tags == await database_service.get_all_tags()
+
+    streamed_files = [
+        f async for f in database_service.iter_files_by_tags(["alpha", "beta"], True)
+    ]
+    assert [f["path"] for f in streamed_files] == [str(metadata1.path)]
+
+
 @pytest.mark.asyncio
 async def test_create_tag(database_service: DatabaseService):
     """Test creating a tag."""
@@ -157,5 +219,76 @@ async def test_create_tag(database_service: DatabaseService):
 
     # Verify tag was created
     all_tags = await database_service.get_all_tags()
-    tag_names = [tag["name"] for tag in all_tags]
+    tag_names = {tag["name"] for tag in all_tags}
     assert "new_tag" in tag_names
+
+
+@pytest.mark.asyncio
+async def test_save_file_metadata_many(
+    database_service: DatabaseService, temp_dir: Path
+):
+    """Test saving metadata for many files in one batch."""
+    metadatas = []
+    for i in range(5):
+        file_path = temp_dir / f"bulk_{i}.txt"
+        file_path.write_text(f"Bulk file {i}")
+        metadatas.append(await FileMetadata.from_path(file_path))
+
+    await database_service.save_file_metadata_many(metadatas)
+    # Saving again must update in place rather than duplicate rows
+    await database_service.save_file_metadata_many(metadatas, durable=False)
+
+    stats = await database_service.get_statistics()
+    assert stats["total_files"] == 5
+    for metadata in metadatas:
+        assert await database_service.get_file_by_path(metadata.path) is not None
+
+
+@pytest.mark.asyncio
+async def test_tag_usage_count_tracks_removals(
+    database_service: DatabaseService, sample_text_file: Path
+):
+    """Test that tag usage counts follow tag additions and removals."""
+    metadata = await FileMetadata.from_path(sample_text_file)
+    await database_service.save_file_metadata(metadata)
+    await database_service.add_tags_to_file(sample_text_file, ["keep", "drop"])
+    # Re-adding an existing association must not double count
+    await database_service.add_tags_to_file(sample_text_file, ["keep"])
+    await database_service.remove_tags_from_file(sample_text_file, ["drop"])
+
+    counts = {
+        t["name"]: t["usage_count"] for t in await database_service.get_all_tags()
+    }
+    assert counts == {"keep": 1, "drop": 0}
+
+
+@pytest.mark.asyncio
+async def test_add_tags_to_files_many(
+    database_service: DatabaseService, temp_dir: Path
+):
+    """Test tagging many files in one batch."""
+    file1 = temp_dir / "file1.txt"
+    file1.write_text("File 1")
+    file2 = temp_dir / "file2.txt"
+    file2.write_text("File 2")
+    for file_path in (file1, file2):
+        await database_service.save_file_metadata(
+            await FileMetadata.from_path(file_path)
+        )
+
+    await database_service.add_tags_to_files_many(
+        [
+            (file1, ["shared", "one"]),
+            (file2, ["shared"]),
+            (temp_dir / "unknown.txt", ["ignored"]),
+        ]
+    )
+
+    assert {t["name"] for t in await database_service.get_file_tags(file1)} == {
+        "shared",
+        "one",
+    }
+    counts = {
+        t["name"]: t["usage_count"] for t in await database_service.get_all_tags()
+    }
+    assert counts == {"shared": 2, "one": 1, "ignored": 0}
@@ -4,9 +4,13 @@ Tests for the ingestion service.
 Tests file metadata extraction, batch processing, and error handling.
 """
 
+import asyncio
 from pathlib import Path
 
 import pytest
+from aichemist_archivum.core.extraction.base_extractor import BaseMetadataExtractor
+from aichemist_archivum.services import ingestion_service as ingestion_module
+from aichemist_archivum.services.database_service import DatabaseService
 from aichemist_archivum.services.ingestion_service import IngestionService
 
 
@@ -72,14 +76,168 @@ async def test_batch_extraction(ingestion_service: IngestionService, temp_dir: P
         file_path.write_text(f"Content of file {i}")
         files.append(file_path)
 
-    # Extract metadata for all files
-    results = []
-    for file_path in files:
-        metadata = await ingestion_service.extract_metadata(file_path)
-        results.append(metadata)
+    # Extract metadata for all files concurrently
+    results = await asyncio.gather(
+        *(ingestion_service.extract_metadata(file_path) for file_path in files)
+    )
 
     # All files should be processed successfully
     assert len(results) == 5
     for metadata in results:
         assert metadata.error is None
         assert metadata.extraction_complete
+
+
+@pytest.mark.asyncio
+async def test_iter_extract_batch(ingestion_service: IngestionService, temp_dir: Path):
+    """Test streaming batch extraction, including a missing file."""
+    files = []
+    for i in range(3):
+        file_path = temp_dir / f"stream_{i}.txt"
+        file_path.write_text(f"Content of file {i}")
+        files.append(file_path)
+    missing = temp_dir / "missing.txt"
+
+    results = [m async for m in ingestion_service.iter_extract_batch([*files, missing])]
+
+    by_path = {m.path: m for m in results}
+    assert set(by_path) == {p.resolve() for p in [*files, missing]}
+    assert all(by_path[p.resolve()].error is None for p in files)
+    assert by_path[missing.resolve()].error is not None
+
+
+@pytest.mark.asyncio
+async def test_extract_batch_keeps_input_order(temp_dir: Path):
+    """Test that batch results follow the input order, past the task window."""
+    ingestion_service = IngestionService(max_concurrent_batch=2)
+    files = []
+    for i in range(5):
+        file_path = temp_dir / f"ordered_{i}.txt"
+        file_path.write_text("x" * (5 - i) * 1000)
+        files.append(file_path)
+
+    results = await ingestion_service.extract_batch([*files, temp_dir / "missing.txt"])
+
+    assert [m.path for m in results] == [
+        p.resolve() for p in [*files, temp_dir / "missing.txt"]
+    ]
+    assert results[-1].error is not None
+
+
+@pytest.mark.asyncio
+async def test_extract_and_persist_batch(
+    ingestion_service: IngestionService,
+    database_service: DatabaseService,
+    temp_dir: Path,
+):
+    """Test that batch extraction results are saved in chunks."""
+    files = []
+    for i in range(5):
+        file_path = temp_dir / f"persist_{i}.txt"
+        file_path.write_text(f"Content of file {i}")
+        files.append(file_path)
+
+    results = [
+        m
+        async for m in ingestion_service.extract_and_persist_batch(
+            files, database_service, chunk_size=2
+        )
+    ]
+
+    assert len(results) == 5
+    assert all(m.error is None for m in results)
+    stats = await database_service.get_statistics()
+    assert stats["total_files"] == 5
+
+
+@pytest.mark.asyncio
+async def test_extract_and_persist_batch_reports_progress_before_saving(
+    ingestion_service: IngestionService,
+    database_service: DatabaseService,
+    temp_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that each extraction is reported before its chunk is saved."""
+    files = []
+    for i in range(5):
+        file_path = temp_dir / f"progress_{i}.txt"
+        file_path.write_text(f"Content of file {i}")
+        files.append(file_path)
+
+    extracted: list[Path] = []
+    reported_at_save: list[int] = []
+    save_many = database_service.save_file_metadata_many
+
+    async def recording_save_many(items):
+        reported_at_save.append(len(extracted))
+        return await save_many(items)
+
+    monkeypatch.setattr(
+        database_service, "save_file_metadata_many", recording_save_many
+    )
+
+    results = [
+        m
+        async for m in ingestion_service.extract_and_persist_batch(
+            files,
+            database_service,
+            chunk_size=2,
+            on_extracted=lambda m: extracted.append(m.path),
+        )
+    ]
+
+    assert reported_at_save == [2, 4, 5]
+    assert set(extracted) == {m.path for m in results}
+
+
+class _ContentLengthExtractor(BaseMetadataExtractor):
+    """Extractor that only works from content handed to it."""
+
+    supported_mime_types = ["*/*"]
+
+    async def extract(self, file_path, content=None, mime_type=None):
+        return {"source": "path"}
+
+    async def extract_with_content(self, file_path, content):
+        return {"source": type(content).__name__, "length": len(content)}
+
+
+@pytest.mark.asyncio
+async def test_extract_metadata_shares_mapped_content(
+    ingestion_service: IngestionService, sample_text_file: Path
+):
+    """Test that content-capable extractors get the file mapped once."""
+    extractors = [_ContentLengthExtractor(), _ContentLengthExtractor()]
+
+    metadata = await ingestion_service.extract_metadata(
+        sample_text_file, extractors_override=extractors
+    )
+
+    assert metadata.error is None
+    extracted = metadata.parsed_data["_ContentLengthExtractor"]
+    assert extracted["source"] == "memoryview"
+    assert extracted["length"] == sample_text_file.stat().st_size
+
+
+@pytest.mark.asyncio
+async def test_cached_extraction_does_not_map_file(
+    ingestion_service: IngestionService,
+    sample_text_file: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test that a fully cached re-extraction never maps the file."""
+    extractors = [_ContentLengthExtractor()]
+    await ingestion_service.extract_metadata(
+        sample_text_file, extractors_override=extractors
+    )
+
+    mapped: list[Path] = []
+    monkeypatch.setattr(ingestion_module, "_map_file", mapped.append)
+
+    metadata = await ingestion_service.extract_metadata(
+        sample_text_file, extractors_override=extractors
+    )
+
+    assert mapped == []
+    assert metadata.error is None
+    assert metadata.parsed_data["_ContentLengthExtractor"]["source"] == "memoryview"
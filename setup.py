@@ -9,37 +9,27 @@ Usage:
     python setup.py
 """
 
-import os
 import subprocess
 import sys
+import sysconfig
 from pathlib import Path
 
+# File inside the venv where start.py looks up the venv's site-packages path
+VENV_SITE_CACHE = "aichemist-site-packages"
+
 
 def run_command(cmd, description, cwd=None):
-    """Run a shell command and handle errors gracefully."""
+    """Run an argv list without a shell, streaming its output to the terminal."""
     print(f"📋 {description}...")
 
     try:
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            check=True,
-            capture_output=True,
-            text=True,
-            cwd=cwd,
-            encoding="utf-8",
-            errors="replace",  # Replace problematic characters
-        )
+        subprocess.run(cmd, check=True, cwd=cwd)
         print(f"✅ {description} completed successfully")
         return True
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError) as e:
         print(f"❌ {description} failed:")
-        print(f"   Command: {cmd}")
-        stderr = e.stderr if e.stderr else e.stdout
-        if stderr:
-            # Clean up Unicode issues in output
-            stderr = stderr.encode("utf-8", errors="replace").decode("utf-8")
-        print(f"   Error: {stderr}")
+        print(f"   Command: {subprocess.list2cmdline(cmd)}")
+        print(f"   Error: {e}")
         return False
 
 
@@ -67,19 +57,46 @@ def check_git():
         return False
 
 
+def venv_paths(venv_path):
+    """Return the install paths (scripts, purelib, ...) of a virtual environment."""
+    names = sysconfig.get_scheme_names()
+    scheme = "venv" if "venv" in names else sysconfig.get_default_scheme()
+    base = str(venv_path)
+    return sysconfig.get_paths(scheme, vars={"base": base, "platbase": base})
+
+
+def venv_python(venv_path):
+    """Return the path of a virtual environment's Python interpreter."""
+    executable = "python" + (sysconfig.get_config_var("EXE") or "")
+    return Path(venv_paths(venv_path)["scripts"]) / executable
+
+
+def cache_site_packages(venv_path):
+    """Record the venv's site-packages path so start.py needn't search for it."""
+    site_packages = Path(venv_paths(venv_path)["purelib"])
+    if site_packages.exists():
+        (venv_path / VENV_SITE_CACHE).write_text(
+            str(site_packages.absolute()), encoding="utf-8"
+        )
+
+
 def setup_virtual_environment():
     """Set up a virtual environment if it doesn't exist."""
     venv_path = Path("venv")
 
     if venv_path.exists():
         print("✅ Virtual environment already exists")
+        cache_site_packages(venv_path)
         return True
 
     print("📋 Creating virtual environment...")
 
     # Try to create virtual environment
-    if run_command(f"{sys.executable} -m venv venv", "Create virtual environment"):
+    if run_command(
+        [sys.executable, "-m", "venv", "venv"], "Create virtual environment"
+    ):
         print("✅ Virtual environment created successfully")
+        cache_site_packages(venv_path)
         return True
     else:
         print("⚠️  Virtual environment creation failed, continuing without it")
@@ -98,34 +115,29 @@ def install_dependencies():
     # Check if we're in a virtual environment or should use one
     venv_path = Path("venv")
     if venv_path.exists():
-        if os.name == "nt":  # Windows
-            python_cmd = str(venv_path / "Scripts" / "python.exe")
-            pip_cmd = f'"{python_cmd}" -m pip'
-        else:  # Unix-like
-            python_cmd = str(venv_path / "bin" / "python")
-            pip_cmd = f'"{python_cmd}" -m pip'
+        python_cmd = str(venv_python(venv_path))
     else:
         python_cmd = sys.executable
-        pip_cmd = f'"{sys.executable}" -m pip'
+    # Skip pip's prompts and its own "new version available" check
+    pip_cmd = [python_cmd, "-m", "pip", "--no-input", "--disable-pip-version-check"]
 
-    # Upgrade pip first (using proper command format)
-    run_command(f"{python_cmd} -m pip install --upgrade pip", "Upgrade pip")
+    # Upgrade pip first
+    run_command([*pip_cmd, "install", "--upgrade", "pip"], "Upgrade pip")
 
     # Install the package in development mode from root directory
     if run_command(
-        f"{pip_cmd} install -e .", "Install AIchemist Archivum", cwd=project_root
+        [*pip_cmd, "install", "-e", "."],
+        "Install AIchemist Archivum",
+        cwd=project_root,
     ):
         return True
 
-    # Fallback: try installing individual dependencies
-    print("📋 Trying to install individual dependencies...")
+    # Fallback: install just the core dependencies
+    print("📋 Trying to install core dependencies directly...")
     deps = ["typer>=0.9.0", "rich>=13.6.0", "aiofiles>=24.1.0", "pyyaml>=6.0.1"]
 
-    for dep in deps:
-        if not run_command(f"{pip_cmd} install {dep}", f"Install {dep}"):
-            return False
-
-    return True
+    # One pip run resolves and downloads them together
+    return run_command([*pip_cmd, "install", *deps], "Install core dependencies")
 
 
 def initialize_system():
@@ -137,13 +149,10 @@ def initialize_system():
         # Set up environment for virtual env if it exists
         venv_path = Path("venv")
         if venv_path.exists():
-            if os.name == "nt":  # Windows
-                python_cmd = str(venv_path / "Scripts" / "python.exe")
-            else:  # Unix-like
-                python_cmd = str(venv_path / "bin" / "python")
+            python_cmd = str(venv_python(venv_path))
 
             # Run initialization using the virtual environment Python
-            cmd = f"{python_cmd} start.py config init --no-interactive"
+            cmd = [python_cmd, "start.py", "config", "init", "--no-interactive"]
             if run_command(cmd, "Initialize system configuration"):
                 print("✅ System initialized successfully")
                 return True
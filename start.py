@@ -12,12 +12,29 @@ Examples:
     python start.py --help
     python start.py config init
     python start.py ingest folder ./my-documents
+
+Pass --skip-checks or set AICHEMIST_SKIP_CHECKS=1 to skip the dependency check,
+e.g. when calling the CLI repeatedly from scripts.
 """
 
+import importlib.util
 import os
 import sys
+import sysconfig
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).parent.absolute()
+VENV_PATH = PROJECT_ROOT / "venv"
+BACKEND_SRC = PROJECT_ROOT / "backend" / "src"
+
+# setup.py records the venv's site-packages path in this file so startup can
+# skip searching lib/ for it; the environment variable overrides the file.
+VENV_SITE_ENV_VAR = "AICHEMIST_VENV_SITE"
+VENV_SITE_CACHE = VENV_PATH / "aichemist-site-packages"
+
+SKIP_CHECKS_FLAG = "--skip-checks"
+SKIP_CHECKS_ENV_VAR = "AICHEMIST_SKIP_CHECKS"
+
 
 def check_python_version():
     """Check if Python version meets requirements."""
@@ -27,46 +44,48 @@ def check_python_version():
         sys.exit(1)
 
 
+def find_site_packages():
+    """Locate the virtual environment's site-packages directory."""
+    # Both hints can go stale (venv recreated for another Python version), so
+    # only trust them while the directory still exists
+    cached = os.environ.get(VENV_SITE_ENV_VAR)
+    if cached and Path(cached).is_dir():
+        return Path(cached)
+    try:
+        cached = VENV_SITE_CACHE.read_text(encoding="utf-8").strip()
+    except OSError:
+        cached = ""
+    if cached and Path(cached).is_dir():
+        return Path(cached)
+
+    # Where this interpreter would install packages into the venv
+    names = sysconfig.get_scheme_names()
+    scheme = "venv" if "venv" in names else sysconfig.get_default_scheme()
+    base = str(VENV_PATH)
+    return Path(sysconfig.get_path("purelib", scheme, {"base": base, "platbase": base}))
+
+
 def setup_environment():
     """Set up the Python path for the application."""
-    # Get the project root directory
-    project_root = Path(__file__).parent.absolute()
-
     # Check if we should use virtual environment
-    venv_path = project_root / "venv"
-    if venv_path.exists():
+    if VENV_PATH.exists():
         # We're using a virtual environment, add its site-packages to path
-        if os.name == "nt":  # Windows
-            site_packages = venv_path / "Lib" / "site-packages"
-        else:  # Unix-like
-            # Find the site-packages directory (version may vary)
-            lib_path = venv_path / "lib"
-            if lib_path.exists():
-                python_dirs = [
-                    d for d in lib_path.iterdir() if d.name.startswith("python")
-                ]
-                if python_dirs:
-                    site_packages = python_dirs[0] / "site-packages"
-                else:
-                    site_packages = None
-            else:
-                site_packages = None
-
+        site_packages = find_site_packages()
         if site_packages and site_packages.exists():
             sys.path.insert(0, str(site_packages))
+            os.environ[VENV_SITE_ENV_VAR] = str(site_packages)
 
     # Also add backend/src for development
-    backend_src = project_root / "backend" / "src"
-    if backend_src.exists():
-        sys.path.insert(0, str(backend_src))
+    if BACKEND_SRC.exists():
+        sys.path.insert(0, str(BACKEND_SRC))
 
     # Set environment variables
     os.environ["PYTHONPATH"] = (
-        str(backend_src) + os.pathsep + os.environ.get("PYTHONPATH", "")
+        str(BACKEND_SRC) + os.pathsep + os.environ.get("PYTHONPATH", "")
     )
-    os.environ["AICHEMIST_PROJECT_ROOT"] = str(project_root)
+    os.environ["AICHEMIST_PROJECT_ROOT"] = str(PROJECT_ROOT)
 
-    return project_root, backend_src
+    return PROJECT_ROOT, BACKEND_SRC
 
 
 def check_dependencies():
@@ -83,9 +102,9 @@ def check_dependencies():
         if package == "asyncio":
             continue  # Built-in module
 
-        try:
-            __import__(package)
-        except ImportError:
+        # find_spec only locates the package; importing it here would run
+        # its initialization just to throw the result away
+        if importlib.util.find_spec(package) is None:
             missing_packages.append(package)
 
     if missing_packages:
@@ -133,13 +152,11 @@ def show_first_time_setup():
 
 def check_system_status():
     """Check if the system has been initialized."""
-    project_root = Path(__file__).parent
-
     # Check for common indicators that system is set up
     indicators = [
-        project_root / ".aichemist-archivum",
+        PROJECT_ROOT / ".aichemist-archivum",
         Path.home() / ".aichemist-archivum",
-        project_root / "data",
+        PROJECT_ROOT / "data",
     ]
 
     for indicator in indicators:
@@ -152,26 +169,16 @@ def check_system_status():
 def run_cli(args):
     """Run the CLI application with the provided arguments."""
     try:
-        # Import the CLI application
-        from aichemist_archivum.interfaces.cli.cli import cli_app
-
-        # IMPORTANT: Import commands to register them with their apps
-        try:
-            from aichemist_archivum.interfaces.cli import commands
-        except ImportError as e:
-            print(f"Warning: Could not import all commands: {e}")
-            # Try to at least import config
-            try:
-                from aichemist_archivum.interfaces.cli.commands import config
-            except ImportError:
-                pass
+        # Import the CLI application; run() imports only the command modules
+        # for the group being invoked
+        from aichemist_archivum.interfaces.cli.cli import run
 
         # Override sys.argv to pass arguments to the CLI
         original_argv = sys.argv
         sys.argv = ["archivum"] + args
 
         try:
-            cli_app()
+            run()
         finally:
             # Restore original argv
             sys.argv = original_argv
@@ -208,6 +215,11 @@ def main():
     # Get command line arguments (skip script name)
     cli_args = sys.argv[1:]
 
+    skip_checks = SKIP_CHECKS_FLAG in cli_args or bool(
+        os.environ.get(SKIP_CHECKS_ENV_VAR)
+    )
+    cli_args = [arg for arg in cli_args if arg != SKIP_CHECKS_FLAG]
+
     # Special handling for 'archivum' alias
     if len(cli_args) > 0 and cli_args[0] == "archivum":
         cli_args = cli_args[1:]  # Remove the 'archivum' part
@@ -222,7 +234,7 @@ def main():
             cli_args = ["--help"]
 
     # Check dependencies
-    if not check_dependencies():
+    if not skip_checks and not check_dependencies():
         print("\n💡 Install dependencies first, then try again.")
         sys.exit(1)
 
@@ -1,12 +1,16 @@
 """Test script to verify config path changes."""
-from backend.src.aichemist_archivum.config.loader.config_loader import get_codex_config
 
-cfg = get_codex_config()
-print(f'Config sources: {cfg.get_loaded_sources()}')
-print(f'Data dir from config: {cfg.get("data_dir")}')
-print(f'Database path: {cfg.get("database.path")}')
-print(f'\n✅ Config loading successful!')
+from aichemist_archivum.config.loader.config_loader import get_codex_config
 
 
+def main():
+    """Load the configuration and print where its paths came from."""
+    cfg = get_codex_config()
+    print(f"Config sources: {cfg.get_loaded_sources()}")
+    print(f"Data dir from config: {cfg.get('data_dir')}")
+    print(f"Database path: {cfg.get('database.path')}")
+    print("\n✅ Config loading successful!")
 
 
+if __name__ == "__main__":
+    main()